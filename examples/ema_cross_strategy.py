@@ -1,30 +1,23 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
+
 from nautilus_core.data import Bar, BarType
 from nautilus_core.enums import OrderSide
 from nautilus_core.identifiers import InstrumentId
 from nautilus_core.indicators.ema import ExponentialMovingAverage
-from nautilus_core.objects import Quantity
 from nautilus_core.trading.config import StrategyConfig
 from nautilus_core.trading.strategy import Strategy
 
 
+@dataclass(frozen=True, slots=True)
 class EMACrossStrategyConfig(StrategyConfig):
-    def __init__(
-        self,
-        instrument_id: str,
-        bar_type: str,
-        fast_period: int = 10,
-        slow_period: int = 20,
-        trade_size: float = 100.0,
-        strategy_id: str = "EMACross",
-    ) -> None:
-        super().__init__(strategy_id=strategy_id)
-        self.instrument_id_str = instrument_id
-        self.bar_type_str = bar_type
-        self.fast_period = fast_period
-        self.slow_period = slow_period
-        self.trade_size = trade_size
+    instrument_id: InstrumentId | str
+    bar_type: BarType | str
+    fast_period: int = 10
+    slow_period: int = 20
+    trade_size: float = 100.0
+    strategy_id: str = field(default="EMACross", kw_only=True)
 
 
 class EMACrossStrategy(Strategy):
@@ -37,7 +30,10 @@ class EMACrossStrategy(Strategy):
         self.slow_ema = ExponentialMovingAverage(config.slow_period)
 
     def on_start(self) -> None:
-        self.instrument_id = InstrumentId.from_str(self._config.instrument_id_str)
+        instrument_id = self._config.instrument_id
+        if not isinstance(instrument_id, InstrumentId):
+            instrument_id = InstrumentId.from_str(instrument_id)
+        self.instrument_id = instrument_id
 
         # Parse bar type from data (we'll subscribe to whatever bar type is in the data)
         # The bar_type is set by the backtest engine when data is added
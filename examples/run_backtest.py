@@ -2,7 +2,6 @@
 """Complete backtest example with synthetic data."""
 from __future__ import annotations
 
-import math
 import sys
 import os
 
@@ -15,7 +14,6 @@ from nautilus_core.backtest.engine import BacktestEngine
 from nautilus_core.data import Bar, BarSpecification, BarType
 from nautilus_core.enums import (
     AccountType,
-    AssetClass,
     BarAggregation,
     OmsType,
     PriceType,
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import math
 from decimal import Decimal
-from typing import Any
+from typing import Any, Iterable
 
 from nautilus_core.account import Account
 from nautilus_core.backtest.exchange import SimulatedExchange
@@ -78,7 +78,9 @@ class BacktestEngine:
         if exchange:
             exchange.add_instrument(instrument)
 
-    def add_data(self, data: list[Bar | QuoteTick | TradeTick]) -> None:
+    def add_data(self, data: Iterable[Bar | QuoteTick | TradeTick]) -> None:
+        # Copied into the engine's own buffer (sorted in place by run), so
+        # callers may share one immutable sequence across engines
         self._data.extend(data)
 
     def add_strategy(self, strategy: Strategy) -> None:
@@ -226,13 +228,14 @@ class BacktestEngine:
         # Sharpe ratio (simplified: using balance returns)
         sharpe = Decimal("0")
         if len(balance_curve) > 2:
-            returns = []
-            for i in range(1, len(balance_curve)):
-                prev_bal = balance_curve[i - 1][1]
-                curr_bal = balance_curve[i][1]
-                if prev_bal > 0:
-                    ret = (curr_bal - prev_bal) / prev_bal
-                    returns.append(float(ret))
+            # Returns only feed a float statistic, so convert each balance once
+            # instead of doing a Decimal division per bar
+            balances = [float(bal) for _, bal in balance_curve]
+            returns = [
+                (curr_bal - prev_bal) / prev_bal
+                for prev_bal, curr_bal in zip(balances, balances[1:])
+                if prev_bal > 0
+            ]
             if returns and len(returns) > 1:
                 mean_ret = sum(returns) / len(returns)
                 variance = sum((r - mean_ret) ** 2 for r in returns) / (len(returns) - 1)
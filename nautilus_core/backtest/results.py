@@ -24,6 +24,12 @@ class BacktestResult:
     avg_loss: Decimal = Decimal("0")
     balance_curve: list[tuple[int, Decimal]] = field(default_factory=list)
 
+    @property
+    def total_return_pct(self) -> float:
+        if not self.starting_balance:
+            return 0.0
+        return float(self.total_return) / float(self.starting_balance) * 100.0
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "start_time_ns": self.start_time_ns,
@@ -34,7 +40,7 @@ class BacktestResult:
             "starting_balance": float(self.starting_balance),
             "ending_balance": float(self.ending_balance),
             "total_return": float(self.total_return),
-            "total_return_pct": float(self.total_return / self.starting_balance * 100) if self.starting_balance else 0,
+            "total_return_pct": self.total_return_pct,
             "total_commissions": float(self.total_commissions),
             "max_drawdown": float(self.max_drawdown),
             "max_drawdown_pct": float(self.max_drawdown / self.starting_balance * 100) if self.starting_balance else 0,
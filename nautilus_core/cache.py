@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from decimal import Decimal
+
 from nautilus_core.account import Account
 from nautilus_core.data import Bar, BarType, QuoteTick, TradeTick
 from nautilus_core.enums import OrderStatus
@@ -32,6 +34,28 @@ class Cache:
         self._positions_by_venue: dict[Venue, list[PositionId]] = {}
         self._positions_by_strategy: dict[StrategyId, list[PositionId]] = {}
         self._positions_by_instrument: dict[InstrumentId, list[PositionId]] = {}
+        self._positions_open_by_instrument: dict[InstrumentId, list[Position]] = {}
+        # Net signed quantity per instrument, kept current from position adds/updates
+        self._net_positions: dict[InstrumentId, Decimal] = {}
+        self._position_signed_qty: dict[PositionId, Decimal] = {}
+
+    def reset(self) -> None:
+        self._instruments.clear()
+        self._accounts.clear()
+        self._orders.clear()
+        self._positions.clear()
+        self._bars.clear()
+        self._quote_ticks.clear()
+        self._trade_ticks.clear()
+        self._orders_by_venue.clear()
+        self._orders_by_strategy.clear()
+        self._orders_by_instrument.clear()
+        self._positions_by_venue.clear()
+        self._positions_by_strategy.clear()
+        self._positions_by_instrument.clear()
+        self._positions_open_by_instrument.clear()
+        self._net_positions.clear()
+        self._position_signed_qty.clear()
 
     # --- Instruments ---
 
@@ -107,9 +131,30 @@ class Cache:
         if position.strategy_id:
             self._positions_by_strategy.setdefault(position.strategy_id, []).append(pid)
         self._positions_by_instrument.setdefault(position.instrument_id, []).append(pid)
+        if position.is_open:
+            self._positions_open_by_instrument.setdefault(position.instrument_id, []).append(position)
+        self._update_net_position(position)
 
     def update_position(self, position: Position) -> None:
         self._positions[position.id] = position
+        self._update_net_position(position)
+        open_positions = self._positions_open_by_instrument.setdefault(position.instrument_id, [])
+        if position.is_open:
+            if position not in open_positions:
+                open_positions.append(position)
+        elif position in open_positions:
+            open_positions.remove(position)
+
+    def _update_net_position(self, position: Position) -> None:
+        signed_qty = position.signed_qty
+        prev = self._position_signed_qty.get(position.id, Decimal("0"))
+        if signed_qty != prev:
+            self._position_signed_qty[position.id] = signed_qty
+            instrument_id = position.instrument_id
+            self._net_positions[instrument_id] = self._net_positions.get(instrument_id, Decimal("0")) + (signed_qty - prev)
+
+    def net_position(self, instrument_id: InstrumentId) -> Decimal:
+        return self._net_positions.get(instrument_id, Decimal("0"))
 
     def position(self, position_id: PositionId) -> Position | None:
         return self._positions.get(position_id)
@@ -117,13 +162,22 @@ class Cache:
     def positions(self, instrument_id: InstrumentId | None = None, strategy_id: StrategyId | None = None) -> list[Position]:
         if instrument_id:
             ids = self._positions_by_instrument.get(instrument_id, [])
-            return [self._positions[pid] for pid in ids if pid in self._positions]
+            return [
+                self._positions[pid]
+                for pid in ids
+                if pid in self._positions and (strategy_id is None or self._positions[pid].strategy_id == strategy_id)
+            ]
         if strategy_id:
             ids = self._positions_by_strategy.get(strategy_id, [])
             return [self._positions[pid] for pid in ids if pid in self._positions]
         return list(self._positions.values())
 
     def positions_open(self, instrument_id: InstrumentId | None = None, strategy_id: StrategyId | None = None) -> list[Position]:
+        if instrument_id:
+            open_positions = self._positions_open_by_instrument.get(instrument_id, ())
+            if strategy_id is None:
+                return list(open_positions)
+            return [p for p in open_positions if p.strategy_id == strategy_id]
         return [p for p in self.positions(instrument_id, strategy_id) if p.is_open]
 
     def positions_closed(self, instrument_id: InstrumentId | None = None, strategy_id: StrategyId | None = None) -> list[Position]:
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 
 from nautilus_core.enums import BarAggregation, OrderSide, PriceType
 from nautilus_core.identifiers import InstrumentId, TradeId
-from nautilus_core.objects import Price, Quantity
+from nautilus_core.objects import Price, Quantity, raw_half_up
 
 
 @dataclass(frozen=True)
@@ -32,7 +32,7 @@ class BarType:
         return repr(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class Bar:
     bar_type: BarType
     open: Price
@@ -59,6 +59,32 @@ class Bar:
             ts_init=d.get("ts_init", 0),
         )
 
+    @classmethod
+    def from_floats(
+        cls,
+        bar_type: BarType,
+        open: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+        price_precision: int,
+        size_precision: int,
+        ts_event: int,
+        ts_init: int,
+    ) -> Bar:
+        # Rounds exactly like Price/Quantity, but builds them from integer raws
+        return cls(
+            bar_type=bar_type,
+            open=Price.from_raw(raw_half_up(open, price_precision), price_precision),
+            high=Price.from_raw(raw_half_up(high, price_precision), price_precision),
+            low=Price.from_raw(raw_half_up(low, price_precision), price_precision),
+            close=Price.from_raw(raw_half_up(close, price_precision), price_precision),
+            volume=Quantity.from_raw(raw_half_up(volume, size_precision), size_precision),
+            ts_event=ts_event,
+            ts_init=ts_init,
+        )
+
     def to_dict(self) -> dict:
         return {
             "bar_type": str(self.bar_type),
@@ -79,7 +105,7 @@ class Bar:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class QuoteTick:
     instrument_id: InstrumentId
     bid_price: Price
@@ -115,7 +141,7 @@ class QuoteTick:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeTick:
     instrument_id: InstrumentId
     price: Price
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Callable
 
 from nautilus_core.cache import Cache
 from nautilus_core.data import Bar, BarType, QuoteTick, TradeTick
@@ -15,6 +15,9 @@ class DataEngine:
         self._bar_subscriptions: dict[BarType, bool] = {}
         self._quote_subscriptions: dict[InstrumentId, bool] = {}
         self._trade_subscriptions: dict[InstrumentId, bool] = {}
+        # Direct bar handlers, called without going through the msgbus
+        self._bar_handlers: dict[BarType, list[Callable]] = {}
+        self._bar_topics: dict[BarType, str] = {}
 
     def subscribe_bars(self, bar_type: BarType) -> None:
         self._bar_subscriptions[bar_type] = True
@@ -22,6 +25,16 @@ class DataEngine:
     def unsubscribe_bars(self, bar_type: BarType) -> None:
         self._bar_subscriptions.pop(bar_type, None)
 
+    def add_bar_handler(self, bar_type: BarType, handler: Callable) -> None:
+        handlers = self._bar_handlers.setdefault(bar_type, [])
+        if handler not in handlers:
+            handlers.append(handler)
+
+    def remove_bar_handler(self, bar_type: BarType, handler: Callable) -> None:
+        handlers = self._bar_handlers.get(bar_type, [])
+        if handler in handlers:
+            handlers.remove(handler)
+
     def subscribe_quote_ticks(self, instrument_id: InstrumentId) -> None:
         self._quote_subscriptions[instrument_id] = True
 
@@ -36,7 +49,14 @@ class DataEngine:
 
     def process_bar(self, bar: Bar) -> None:
         self._cache.add_bar(bar)
-        topic = f"data.bars.{bar.bar_type}"
+        bar_type = bar.bar_type
+        handlers = self._bar_handlers.get(bar_type)
+        if handlers:
+            for handler in handlers:
+                handler(bar)
+        topic = self._bar_topics.get(bar_type)
+        if topic is None:
+            topic = self._bar_topics[bar_type] = f"data.bars.{bar_type}"
         self._msgbus.publish(topic, bar)
 
     def process_quote_tick(self, tick: QuoteTick) -> None:
@@ -1,25 +1,35 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 
 class _Identifier:
-    __slots__ = ("_value",)
+    __slots__ = ("_value", "_hash")
 
     def __init__(self, value: str) -> None:
         if not value:
             raise ValueError(f"{type(self).__name__} value must be non-empty")
         self._value = value
+        # Identifiers key most of the engine's dicts, so hash once
+        self._hash = hash((type(self).__name__, value))
+
+    def __reduce__(self):
+        # The cached hash is only valid in this process, so rebuild on unpickle
+        return type(self), (self._value,)
 
     @property
     def value(self) -> str:
         return self._value
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, type(self)):
             return NotImplemented
         return self._value == other._value
 
     def __hash__(self) -> int:
-        return hash((type(self).__name__, self._value))
+        return self._hash
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}('{self._value}')"
@@ -39,11 +49,16 @@ class StrategyId(_Identifier):
 class InstrumentId(_Identifier):
     """Format: SYMBOL.VENUE"""
 
+    __slots__ = ("_symbol", "_venue")
+
     def __init__(self, symbol: Symbol, venue: Venue) -> None:
         super().__init__(f"{symbol.value}.{venue.value}")
         self._symbol = symbol
         self._venue = venue
 
+    def __reduce__(self):
+        return InstrumentId, (self._symbol, self._venue)
+
     @property
     def symbol(self) -> Symbol:
         return self._symbol
@@ -53,6 +68,7 @@ class InstrumentId(_Identifier):
         return self._venue
 
     @classmethod
+    @lru_cache(maxsize=4096)
     def from_str(cls, value: str) -> InstrumentId:
         parts = value.rsplit(".", 1)
         if len(parts) != 2:
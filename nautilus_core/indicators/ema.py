@@ -12,14 +12,16 @@ class ExponentialMovingAverage(Indicator):
         self._multiplier = 2.0 / (period + 1.0)
 
     def handle_bar(self, bar: Bar) -> None:
+        self.update_raw(bar.close.as_double())
+
+    def update_raw(self, value: float) -> None:
         self.has_inputs = True
         self._count += 1
-        price = bar.close.as_double()
 
         if self._count == 1:
-            self.value = price
+            self.value = value
         else:
-            self.value = (price - self.value) * self._multiplier + self.value
+            self.value = (value - self.value) * self._multiplier + self.value
 
         if self._count >= self.period:
             self.initialized = True
@@ -12,14 +12,25 @@ class SimpleMovingAverage(Indicator):
         self.period = period
         self.value: float = 0.0
         self._prices: deque[float] = deque(maxlen=period)
+        self._sum = 0.0
 
     def handle_bar(self, bar: Bar) -> None:
+        self.update_raw(bar.close.as_double())
+
+    def update_raw(self, value: float) -> None:
         self.has_inputs = True
         self._count += 1
-        price = bar.close.as_double()
-        self._prices.append(price)
+        prices = self._prices
+        if len(prices) == self.period:
+            self._sum -= prices[0]
+        prices.append(value)
+        self._sum += value
+
+        # Re-sum once per window so rounding drift in the running sum can't accumulate
+        if self._count % self.period == 0:
+            self._sum = sum(prices)
 
-        self.value = sum(self._prices) / len(self._prices)
+        self.value = self._sum / len(prices)
 
         if self._count >= self.period:
             self.initialized = True
@@ -28,3 +39,4 @@ class SimpleMovingAverage(Indicator):
         super().reset()
         self.value = 0.0
         self._prices.clear()
+        self._sum = 0.0
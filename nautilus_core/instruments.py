@@ -8,6 +8,29 @@ from nautilus_core.objects import Currency, Price, Quantity
 
 
 class Instrument:
+    __slots__ = (
+        "id",
+        "symbol",
+        "venue",
+        "asset_class",
+        "quote_currency",
+        "base_currency",
+        "price_precision",
+        "size_precision",
+        "price_increment",
+        "size_increment",
+        "multiplier",
+        "lot_size",
+        "maker_fee",
+        "taker_fee",
+        "min_quantity",
+        "max_quantity",
+        "min_price",
+        "max_price",
+        "ts_event",
+        "ts_init",
+    )
+
     def __init__(
         self,
         instrument_id: InstrumentId,
@@ -69,6 +92,8 @@ class Instrument:
 
 
 class CurrencyPair(Instrument):
+    __slots__ = ()
+
     def __init__(
         self,
         instrument_id: InstrumentId,
@@ -108,6 +133,8 @@ class CurrencyPair(Instrument):
 
 
 class Equity(Instrument):
+    __slots__ = ()
+
     def __init__(
         self,
         instrument_id: InstrumentId,
@@ -147,6 +174,8 @@ class Equity(Instrument):
 
 
 class CryptoPerpetual(Instrument):
+    __slots__ = ("settlement_currency",)
+
     def __init__(
         self,
         instrument_id: InstrumentId,
@@ -190,6 +219,8 @@ class CryptoPerpetual(Instrument):
 
 
 class FuturesContract(Instrument):
+    __slots__ = ("expiry_date",)
+
     def __init__(
         self,
         instrument_id: InstrumentId,
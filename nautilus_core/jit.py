@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+# numba is optional: without it, njit-decorated kernels run as plain Python
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        return lambda func: func
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 from decimal import ROUND_HALF_UP, Decimal
 
@@ -29,6 +30,16 @@ ETH = Currency("ETH", 8, CurrencyType.CRYPTO)
 USDT = Currency("USDT", 2, CurrencyType.CRYPTO)
 
 
+def raw_half_up(value: float, precision: int) -> int:
+    # Same raw as Price(value, precision) / Quantity(value, precision), which round
+    # Decimal(str(value)) half up; only values next to a half tick take the Decimal path
+    scaled = value * 10 ** precision
+    raw = math.floor(scaled + 0.5)
+    if abs(abs(scaled - raw) - 0.5) <= 1e-9 + abs(scaled) * 1e-12:
+        return int(Decimal(str(value)).scaleb(precision).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+    return raw
+
+
 class Price:
     __slots__ = ("_value", "_precision")
 
@@ -37,6 +48,14 @@ class Price:
         d = Decimal(str(value))
         self._value = d.quantize(Decimal(10) ** -precision, rounding=ROUND_HALF_UP)
 
+    @classmethod
+    def from_raw(cls, raw: int, precision: int) -> Price:
+        # raw is the value in units of 10**-precision, e.g. (5025, 4) -> 0.5025
+        price = cls.__new__(cls)
+        price._precision = precision
+        price._value = Decimal(raw).scaleb(-precision)
+        return price
+
     @property
     def value(self) -> Decimal:
         return self._value
@@ -114,6 +133,15 @@ class Quantity:
         if self._value < 0:
             raise ValueError(f"Quantity value must be non-negative, got {self._value}")
 
+    @classmethod
+    def from_raw(cls, raw: int, precision: int) -> Quantity:
+        if raw < 0:
+            raise ValueError(f"Quantity raw value must be non-negative, got {raw}")
+        qty = cls.__new__(cls)
+        qty._precision = precision
+        qty._value = Decimal(raw).scaleb(-precision)
+        return qty
+
     @property
     def value(self) -> Decimal:
         return self._value
@@ -9,14 +9,13 @@ from nautilus_core.objects import Currency, Money, Price
 
 
 class Portfolio:
+    __slots__ = ("_cache",)
+
     def __init__(self, cache: Cache) -> None:
         self._cache = cache
 
     def net_position(self, instrument_id: InstrumentId) -> Decimal:
-        total = Decimal("0")
-        for pos in self._cache.positions_open(instrument_id=instrument_id):
-            total += pos.signed_qty
-        return total
+        return self._cache.net_position(instrument_id)
 
     def is_net_long(self, instrument_id: InstrumentId) -> bool:
         return self.net_position(instrument_id) > 0
@@ -34,10 +33,7 @@ class Portfolio:
         return total
 
     def realized_pnl(self, instrument_id: InstrumentId) -> Decimal:
-        total = Decimal("0")
-        for pos in self._cache.positions(instrument_id=instrument_id):
-            total += pos.realized_pnl
-        return total
+        return self._pnl_pass(instrument_id, None)[0]
 
     def net_exposure(self, instrument_id: InstrumentId, last_price: Price) -> Decimal:
         total = Decimal("0")
@@ -46,7 +42,18 @@ class Portfolio:
         return total
 
     def total_pnl(self, instrument_id: InstrumentId, last_price: Price) -> Decimal:
-        return self.realized_pnl(instrument_id) + self.unrealized_pnl(instrument_id, last_price)
+        realized, unrealized = self._pnl_pass(instrument_id, last_price)
+        return realized + unrealized
+
+    def _pnl_pass(self, instrument_id: InstrumentId, last_price: Price | None) -> tuple[Decimal, Decimal]:
+        # Open positions are a subset of all positions, so one pass yields both sums
+        realized = Decimal("0")
+        unrealized = Decimal("0")
+        for pos in self._cache.positions(instrument_id=instrument_id):
+            realized += pos.realized_pnl
+            if last_price is not None and pos.is_open:
+                unrealized += pos.unrealized_pnl(last_price)
+        return realized, unrealized
 
     def balance_total(self, venue: Venue, currency: Currency | None = None) -> Money | None:
         account = self._cache.account_for_venue(venue)
@@ -7,8 +7,40 @@ from nautilus_core.events import OrderFilled
 from nautilus_core.identifiers import InstrumentId, PositionId, StrategyId, TraderId
 from nautilus_core.objects import Currency, Money, Price, Quantity
 
+_BUY = OrderSide.BUY
+
+# Integer position sides used on the hot path (sign of the signed quantity)
+_FLAT = 0
+_LONG = 1
+_SHORT = -1
+
+_SIDE_ENUMS = {
+    _FLAT: PositionSide.FLAT,
+    _LONG: PositionSide.LONG,
+    _SHORT: PositionSide.SHORT,
+}
+
 
 class Position:
+    __slots__ = (
+        "instrument_id",
+        "id",
+        "trader_id",
+        "strategy_id",
+        "account_id",
+        "currency",
+        "_side_int",
+        "quantity",
+        "signed_qty",
+        "avg_px_open",
+        "avg_px_close",
+        "realized_pnl",
+        "commissions",
+        "_events",
+        "_qty_precision",
+        "_px_precision",
+    )
+
     def __init__(self, instrument_id: InstrumentId, position_id: PositionId, fill: OrderFilled) -> None:
         self.instrument_id = instrument_id
         self.id = position_id
@@ -17,7 +49,7 @@ class Position:
         self.account_id = fill.account_id
         self.currency = fill.currency
 
-        self.side = PositionSide.FLAT
+        self._side_int = _FLAT
         self.quantity = Quantity(0, fill.last_qty.precision)
         self.signed_qty = Decimal("0")
         self.avg_px_open = Decimal("0")
@@ -30,21 +62,25 @@ class Position:
 
         self.apply(fill)
 
+    @property
+    def side(self) -> PositionSide:
+        return _SIDE_ENUMS[self._side_int]
+
     @property
     def is_open(self) -> bool:
-        return self.side != PositionSide.FLAT
+        return self._side_int != _FLAT
 
     @property
     def is_closed(self) -> bool:
-        return self.side == PositionSide.FLAT and len(self._events) > 0
+        return self._side_int == _FLAT and len(self._events) > 0
 
     @property
     def is_long(self) -> bool:
-        return self.side == PositionSide.LONG
+        return self._side_int == _LONG
 
     @property
     def is_short(self) -> bool:
-        return self.side == PositionSide.SHORT
+        return self._side_int == _SHORT
 
     @property
     def events(self) -> list[OrderFilled]:
@@ -65,11 +101,15 @@ class Position:
         fill_px = fill.last_px.value
 
         # Track commission
-        if fill.commission:
-            curr = fill.commission.currency
-            self.commissions[curr] = self.commissions.get(curr, Decimal("0")) + fill.commission.amount
-
-        if fill.order_side == OrderSide.BUY:
+        commission = fill.commission
+        if commission:
+            curr = commission.currency
+            try:
+                self.commissions[curr] += commission.amount
+            except KeyError:
+                self.commissions[curr] = commission.amount
+
+        if fill.order_side == _BUY:
             self._apply_buy(fill_qty, fill_px)
         else:
             self._apply_sell(fill_qty, fill_px)
@@ -77,13 +117,14 @@ class Position:
         self._events.append(fill)
 
     def _apply_buy(self, fill_qty: Decimal, fill_px: Decimal) -> None:
-        if self.side == PositionSide.FLAT or self.side == PositionSide.LONG:
+        side = self._side_int
+        if side == _FLAT or side == _LONG:
             # Opening or adding to long
             total_qty = abs(self.signed_qty) + fill_qty
             if total_qty > 0:
                 self.avg_px_open = (self.avg_px_open * abs(self.signed_qty) + fill_px * fill_qty) / total_qty
             self.signed_qty += fill_qty
-        elif self.side == PositionSide.SHORT:
+        elif side == _SHORT:
             # Closing or reducing short
             close_qty = min(fill_qty, abs(self.signed_qty))
             pnl = close_qty * (self.avg_px_open - fill_px)
@@ -102,13 +143,14 @@ class Position:
         self._update_side_and_qty()
 
     def _apply_sell(self, fill_qty: Decimal, fill_px: Decimal) -> None:
-        if self.side == PositionSide.FLAT or self.side == PositionSide.SHORT:
+        side = self._side_int
+        if side == _FLAT or side == _SHORT:
             # Opening or adding to short
             total_qty = abs(self.signed_qty) + fill_qty
             if total_qty > 0:
                 self.avg_px_open = (self.avg_px_open * abs(self.signed_qty) + fill_px * fill_qty) / total_qty
             self.signed_qty -= fill_qty
-        elif self.side == PositionSide.LONG:
+        elif side == _LONG:
             # Closing or reducing long
             close_qty = min(fill_qty, abs(self.signed_qty))
             pnl = close_qty * (fill_px - self.avg_px_open)
@@ -128,21 +170,19 @@ class Position:
 
     def _update_side_and_qty(self) -> None:
         if self.signed_qty > 0:
-            self.side = PositionSide.LONG
+            self._side_int = _LONG
         elif self.signed_qty < 0:
-            self.side = PositionSide.SHORT
+            self._side_int = _SHORT
         else:
-            self.side = PositionSide.FLAT
+            self._side_int = _FLAT
         self.quantity = Quantity(abs(self.signed_qty), self._qty_precision)
 
     def unrealized_pnl(self, last_price: Price) -> Decimal:
-        if self.side == PositionSide.FLAT:
+        side = self._side_int
+        if side == _FLAT:
             return Decimal("0")
-        last_px = last_price.value
-        if self.side == PositionSide.LONG:
-            return abs(self.signed_qty) * (last_px - self.avg_px_open)
-        else:
-            return abs(self.signed_qty) * (self.avg_px_open - last_px)
+        # The sign of the signed quantity covers both long and short
+        return self.signed_qty * (last_price.value - self.avg_px_open)
 
     def total_pnl(self, last_price: Price) -> Decimal:
         return self.realized_pnl + self.unrealized_pnl(last_price)
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from nautilus_core.enums import OmsType
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, kw_only=True)
 class StrategyConfig:
     strategy_id: str = ""
     oms_type: OmsType = OmsType.HEDGING
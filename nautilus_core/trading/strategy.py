@@ -175,10 +175,27 @@ class Strategy:
     def subscribe_bars(self, bar_type: BarType) -> None:
         if self._data_engine:
             self._data_engine.subscribe_bars(bar_type)
-        if self.msgbus:
+            self.attach_bar_handler(bar_type, self._handle_bar)
+        elif self.msgbus:
             topic = f"data.bars.{bar_type}"
             self.msgbus.subscribe(topic, self._handle_bar)
 
+    def unsubscribe_bars(self, bar_type: BarType) -> None:
+        if self._data_engine:
+            self._data_engine.unsubscribe_bars(bar_type)
+            self.detach_bar_handler(bar_type, self._handle_bar)
+        elif self.msgbus:
+            topic = f"data.bars.{bar_type}"
+            self.msgbus.unsubscribe(topic, self._handle_bar)
+
+    def attach_bar_handler(self, bar_type: BarType, handler) -> None:
+        if self._data_engine:
+            self._data_engine.add_bar_handler(bar_type, handler)
+
+    def detach_bar_handler(self, bar_type: BarType, handler) -> None:
+        if self._data_engine:
+            self._data_engine.remove_bar_handler(bar_type, handler)
+
     def subscribe_quote_ticks(self, instrument_id: InstrumentId) -> None:
         if self._data_engine:
             self._data_engine.subscribe_quote_ticks(instrument_id)
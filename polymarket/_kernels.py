@@ -0,0 +1,78 @@
+"""
+Numba-compiled entry/exit decisions for the example strategies.
+
+Each kernel takes the bar's close (or indicator values) and the current
+position state and returns one of the SIGNAL_* codes; the strategies only
+perform the resulting order submission.
+
+The kernels are branchless: buy and close conditions are evaluated as 0/1
+ints and packed as ``buy | close << 1`` (flat and long are exclusive, so at
+most one bit is set), which compiles to compares and bitwise ops instead of
+data-dependent jumps.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+from nautilus_core.jit import njit
+
+
+SIGNAL_HOLD = 0
+SIGNAL_BUY = 1
+SIGNAL_CLOSE = 2
+
+
+@njit(cache=True, fastmath=True)
+def mean_rev_signal(
+    price: float,
+    mean: float,
+    entry_threshold: float,
+    exit_threshold: float,
+    is_flat: bool,
+    is_long: bool,
+) -> int:
+    diff = price - mean
+    buy = int(is_flat) & int(diff < -entry_threshold)
+    close = int(is_long) & int(diff > exit_threshold)
+    return buy | (close << 1)
+
+
+@njit(cache=True, fastmath=True)
+def momentum_signal(fast: float, slow: float, is_flat: bool, is_long: bool) -> int:
+    rising = int(fast > slow)
+    return (int(is_flat) & rising) | ((int(is_long) & (rising ^ 1)) << 1)
+
+
+@njit(cache=True, fastmath=True)
+def value_signal(price: float, fair: float, edge: float, is_flat: bool, is_long: bool) -> int:
+    buy = int(is_flat) & int(price < fair - edge)
+    close = int(is_long) & int(price >= fair)
+    return buy | (close << 1)
+
+
+@njit(cache=True)
+def replay_long_only(buy_mask: np.ndarray, close_mask: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Walk the flat/long state machine over precomputed entry/exit masks.
+
+    Returns the bar indices where the position changes and the signal
+    (SIGNAL_BUY or SIGNAL_CLOSE) taken at each of them.
+    """
+    n = buy_mask.shape[0]
+    indices = np.empty(n, dtype=np.int64)
+    signals = np.empty(n, dtype=np.int8)
+    k = 0
+    is_long = False
+    for i in range(n):
+        if is_long:
+            if close_mask[i]:
+                indices[k] = i
+                signals[k] = SIGNAL_CLOSE
+                k += 1
+                is_long = False
+        elif buy_mask[i]:
+            indices[k] = i
+            signals[k] = SIGNAL_BUY
+            k += 1
+            is_long = True
+    return indices[:k], signals[:k]
@@ -0,0 +1,31 @@
+"""
+Ahead-of-time build of the strategy signal kernels.
+
+Compiles the functions in ``polymarket._kernels`` into a native extension,
+``polymarket._signal_kernels``, so short backtests don't pay the numba JIT
+warm-up on the first bar.  Build it once with::
+
+    python -m polymarket._kernels_aot
+
+``polymarket.strategies`` uses the compiled module when it is present and
+falls back to the JIT (or plain Python) kernels otherwise.
+"""
+from __future__ import annotations
+
+import os
+
+from numba.pycc import CC
+
+from polymarket import _kernels
+
+
+cc = CC("_signal_kernels")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+cc.export("mean_rev_signal", "i1(f8, f8, f8, f8, b1, b1)")(_kernels.mean_rev_signal.py_func)
+cc.export("momentum_signal", "i1(f8, f8, b1, b1)")(_kernels.momentum_signal.py_func)
+cc.export("value_signal", "i1(f8, f8, f8, b1, b1)")(_kernels.value_signal.py_func)
+
+
+if __name__ == "__main__":
+    cc.compile()
@@ -7,20 +7,43 @@ CLOB timeseries: https://docs.polymarket.com/developers/CLOB/timeseries
 """
 from __future__ import annotations
 
+import asyncio
 import json
+import os
+import random
+import re
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from decimal import Decimal
-from typing import Any
+from typing import Any, Iterator
 
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from nautilus_core.data import Bar
+from nautilus_core.objects import Price, Quantity
+from polymarket.instruments import PRICE_PRECISION, bar_type_for, price_raws
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional; stdlib json also accepts bytes
+    _json_loads = json.loads
+
+try:
+    import msgspec
+except ImportError:  # msgspec is optional; markets are then parsed via dicts
+    msgspec = None
 
 
 # ---------------------------------------------------------------------------
 # Data structures
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class PolymarketMarket:
     """Represents a single Polymarket market (one question, two outcomes)."""
     condition_id: str
@@ -35,8 +58,8 @@ class PolymarketMarket:
     liquidity: float
     end_date: str
     description: str = ""
-    # optional extras from the raw API
-    raw: dict = field(default_factory=dict, repr=False)
+    # full API dict, only kept when requested with include_raw=True
+    raw: dict | None = field(default=None, repr=False)
 
     @property
     def yes_token_id(self) -> str:
@@ -57,7 +80,7 @@ class PolymarketMarket:
         return self.outcome_prices[1] if len(self.outcome_prices) > 1 else 0.0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PricePoint:
     """A single (timestamp, price) from the prices-history endpoint."""
     timestamp: int   # unix seconds
@@ -71,6 +94,227 @@ class PricePoint:
 GAMMA_HOST = "https://gamma-api.polymarket.com"
 CLOB_HOST = "https://clob.polymarket.com"
 
+# Response cache lifetimes (seconds) used when requests-cache is installed.
+# Unless a cache_path is given, the cache lives in the user cache directory
+CACHE_NAME = "polymarket"
+GAMMA_CACHE_EXPIRY = 300
+PRICE_HISTORY_CACHE_EXPIRY = 30
+
+# Transient failures (connection errors, 5xx) are retried with jittered
+# exponential backoff: 0.1s, 0.2s, 0.4s ... capped at 2s
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.1
+RETRY_BACKOFF_MAX = 2.0
+RETRY_STATUS_CODES = (500, 502, 503, 504)
+POOL_MAXSIZE = 16
+
+# Live midpoint / order book polling: after LIVE_FAIL_MAX consecutive
+# failures the CLOB is not called for LIVE_RESET_TIMEOUT seconds, and
+# values younger than LIVE_STALE_TTL are served in the meantime
+LIVE_FAIL_MAX = 5
+LIVE_RESET_TIMEOUT = 30.0
+LIVE_STALE_TTL = 2.0
+MIDPOINT_COALESCE_WINDOW = 0.2
+
+# Conditional GET: ETag / Last-Modified and body are remembered for this
+# many of the most recently used (url, params) keys
+VALIDATOR_CACHE_SIZE = 128
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when live CLOB requests are short-circuited after repeated failures."""
+
+
+def _markets_params(
+    limit: int,
+    offset: int,
+    active: bool | None,
+    closed: bool | None,
+    order: str,
+    ascending: bool,
+) -> dict[str, Any]:
+    params: dict[str, Any] = {
+        "limit": limit,
+        "offset": offset,
+        "order": order,
+        "ascending": str(ascending).lower(),
+    }
+    if active is not None:
+        params["active"] = str(active).lower()
+    if closed is not None:
+        params["closed"] = str(closed).lower()
+    return params
+
+
+def _price_history_params(
+    token_id: str,
+    interval: str | None,
+    start_ts: int | None,
+    end_ts: int | None,
+    fidelity: int | None,
+) -> dict[str, Any]:
+    params: dict[str, Any] = {"market": token_id}
+    if interval is not None:
+        params["interval"] = interval
+    if start_ts is not None:
+        params["startTs"] = start_ts
+    if end_ts is not None:
+        params["endTs"] = end_ts
+    if fidelity is not None:
+        params["fidelity"] = fidelity
+    return params
+
+
+def _parse_price_history_arrays(data: dict) -> tuple[np.ndarray, np.ndarray]:
+    history = data.get("history", [])
+    n = len(history)
+    timestamps = np.fromiter((pt["t"] for pt in history), dtype=np.int64, count=n)
+    prices = np.fromiter((pt["p"] for pt in history), dtype=np.float64, count=n)
+    return timestamps, prices
+
+
+if msgspec is not None:
+
+    class _GammaMarket(msgspec.Struct, rename="camel"):
+        """The subset of a Gamma market read by ``PolymarketMarket``."""
+        condition_id: str = ""
+        question: str = ""
+        slug: str = ""
+        outcomes: str | None = None
+        outcome_prices: str | None = None
+        clob_token_ids: str | None = None
+        active: bool = False
+        closed: bool = False
+        volume_num: float | None = None
+        volume: float | str | None = None
+        liquidity_num: float | None = None
+        liquidity: float | str | None = None
+        end_date: str = ""
+        description: str = ""
+
+    _decode_gamma_markets = msgspec.json.Decoder(list[_GammaMarket]).decode
+    _decode_str_list = msgspec.json.Decoder(list[str]).decode
+    # outcomePrices arrives as a list of numeric strings
+    _decode_float_list = msgspec.json.Decoder(list[float], strict=False).decode
+
+
+def _market_from_struct(m: _GammaMarket) -> PolymarketMarket:
+    return PolymarketMarket(
+        condition_id=m.condition_id,
+        question=m.question,
+        slug=m.slug,
+        outcomes=_decode_str_list(m.outcomes) if m.outcomes else [],
+        outcome_prices=_decode_float_list(m.outcome_prices) if m.outcome_prices else [],
+        clob_token_ids=_decode_str_list(m.clob_token_ids) if m.clob_token_ids else [],
+        active=m.active,
+        closed=m.closed,
+        volume=float(m.volume_num if m.volume_num is not None else m.volume or 0),
+        liquidity=float(m.liquidity_num if m.liquidity_num is not None else m.liquidity or 0),
+        end_date=m.end_date,
+        description=m.description,
+    )
+
+
+def _parse_markets(content: bytes, include_raw: bool) -> Iterator[PolymarketMarket]:
+    """
+    Parse a Gamma ``/markets`` response body.
+
+    With msgspec installed (and no raw dicts requested), the JSON is decoded
+    straight into typed structs without building intermediate dicts.
+    Responses that do not fit the schema fall back to the dict parser.
+    """
+    if msgspec is not None and not include_raw:
+        try:
+            structs = _decode_gamma_markets(content)
+        except msgspec.ValidationError:
+            pass
+        else:
+            return map(_market_from_struct, structs)
+    return (
+        PolymarketDataClient._parse_market(m, include_raw)
+        for m in _json_loads(content)
+    )
+
+
+def window_price_history(
+    timestamps: np.ndarray,
+    prices: np.ndarray,
+    start_ts: int | None = None,
+    end_ts: int | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Slice ``get_price_history_arrays`` output to ``start_ts <= t < end_ts``.
+
+    The timestamps are sorted, so the bounds are found by binary search and
+    the returned arrays are views, not copies.
+
+    Parameters
+    ----------
+    timestamps : np.ndarray
+        Sorted unix timestamps (seconds).
+    prices : np.ndarray
+        Prices aligned with ``timestamps``.
+    start_ts : int, optional
+        Inclusive start; defaults to the first point.
+    end_ts : int, optional
+        Exclusive end; defaults to past the last point.
+    """
+    lo = 0 if start_ts is None else int(np.searchsorted(timestamps, start_ts))
+    hi = len(timestamps) if end_ts is None else int(np.searchsorted(timestamps, end_ts))
+    return timestamps[lo:hi], prices[lo:hi]
+
+
+def _to_price_points(timestamps: np.ndarray, prices: np.ndarray) -> list[PricePoint]:
+    return [PricePoint(timestamp=t, price=p) for t, p in zip(timestamps.tolist(), prices.tolist())]
+
+
+class _CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker with a single half-open trial.
+
+    Once open, the first ``allow()`` after ``reset_timeout`` lets exactly
+    one request through; every other caller is refused until that trial
+    is recorded as a success (closing the circuit) or a failure
+    (re-opening it for another ``reset_timeout``).
+    """
+
+    __slots__ = ("fail_max", "reset_timeout", "_failures", "_opened_at", "_trial_in_flight", "_lock")
+
+    def __init__(self, fail_max: int, reset_timeout: float) -> None:
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._trial_in_flight or time.monotonic() - self._opened_at < self.reset_timeout:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or self._failures >= self.fail_max:
+                self._opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+    def record_abort(self) -> None:
+        """Release a half-open trial that ended without a verdict (e.g. a 4xx)."""
+        with self._lock:
+            self._trial_in_flight = False
+
 
 class PolymarketDataClient:
     """Read-only client for Polymarket market data."""
@@ -80,11 +324,109 @@ class PolymarketDataClient:
         gamma_host: str = GAMMA_HOST,
         clob_host: str = CLOB_HOST,
         request_timeout: int = 30,
+        use_cache: bool = True,
+        cache_path: str | os.PathLike | None = None,
     ) -> None:
         self.gamma_host = gamma_host.rstrip("/")
         self.clob_host = clob_host.rstrip("/")
         self.timeout = request_timeout
-        self._session = requests.Session()
+        self._session = self._mount_retries(self._make_session(use_cache, cache_path))
+        # (url, params) -> (ETag, Last-Modified, body) of the last 200 reply,
+        # least recently used first.  requests-cache revalidates expired
+        # responses itself, so this is only kept for a plain session.
+        self._validators: OrderedDict[tuple, tuple[str | None, str | None, bytes]] | None = (
+            None if hasattr(self._session, "cache") else OrderedDict()
+        )
+        self._live_breaker = _CircuitBreaker(LIVE_FAIL_MAX, LIVE_RESET_TIMEOUT)
+        # token_id -> (monotonic time, parsed response) of the last success
+        self._last_midpoint: dict[str, tuple[float, dict]] = {}
+        self._last_book: dict[str, tuple[float, dict]] = {}
+
+    def _make_session(self, use_cache: bool, cache_path: str | os.PathLike | None) -> requests.Session:
+        """
+        Gamma and price-history responses change slowly, so they are cached
+        on disk (keyed by URL + params) when requests-cache is installed.
+        Live midpoint / order book requests are never cached.
+
+        The SQLite file is ``cache_path`` if given, otherwise
+        ``polymarket.sqlite`` in the user cache directory (never the CWD).
+        """
+        if use_cache:
+            try:
+                from requests_cache import DO_NOT_CACHE, CachedSession
+            except ImportError:
+                pass
+            else:
+                return CachedSession(
+                    cache_name=cache_path or CACHE_NAME,
+                    backend="sqlite",
+                    use_cache_dir=cache_path is None,
+                    expire_after=GAMMA_CACHE_EXPIRY,
+                    urls_expire_after={
+                        f"{self.clob_host}/prices-history": PRICE_HISTORY_CACHE_EXPIRY,
+                        f"{self.clob_host}/midpoint": DO_NOT_CACHE,
+                        f"{self.clob_host}/book": DO_NOT_CACHE,
+                    },
+                )
+        return requests.Session()
+
+    @staticmethod
+    def _mount_retries(session: requests.Session) -> requests.Session:
+        retry = Retry(
+            total=MAX_RETRIES,
+            backoff_factor=RETRY_BACKOFF,
+            backoff_max=RETRY_BACKOFF_MAX,
+            backoff_jitter=RETRY_BACKOFF,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset({"GET"}),
+        )
+        adapter = HTTPAdapter(pool_maxsize=POOL_MAXSIZE, max_retries=retry)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _get_conditional(self, url: str, params: dict[str, Any]) -> bytes:
+        """
+        GET ``url`` with the validators of the previous response, reusing its
+        body when the server answers 304 Not Modified.
+
+        Only the ``VALIDATOR_CACHE_SIZE`` most recently used responses are
+        kept.  A 304 without a remembered body is retried unconditionally.
+        """
+        validators = self._validators
+        if validators is None:
+            resp = self._session.get(url, params=params, timeout=self.timeout)
+            resp.raise_for_status()
+            return resp.content
+
+        key = (url, tuple(params.items()))
+        cached = validators.get(key)
+        headers = {}
+        if cached is not None:
+            validators.move_to_end(key)
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        resp = self._session.get(url, params=params, headers=headers, timeout=self.timeout)
+        if resp.status_code == 304:
+            if cached is not None:
+                return cached[2]
+            resp = self._session.get(
+                url, params=params, headers={"Cache-Control": "no-cache"}, timeout=self.timeout,
+            )
+        resp.raise_for_status()
+
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        if etag or last_modified:
+            validators[key] = (etag, last_modified, resp.content)
+            validators.move_to_end(key)
+            if len(validators) > VALIDATOR_CACHE_SIZE:
+                validators.popitem(last=False)
+        return resp.content
 
     # ── Gamma API — market discovery ──────────────────────────────────
 
@@ -97,26 +439,39 @@ class PolymarketDataClient:
         closed: bool | None = None,
         order: str = "volume",
         ascending: bool = False,
+        include_raw: bool = False,
     ) -> list[PolymarketMarket]:
         """Fetch a page of markets from the Gamma API."""
-        params: dict[str, Any] = {
-            "limit": limit,
-            "offset": offset,
-            "order": order,
-            "ascending": str(ascending).lower(),
-        }
-        if active is not None:
-            params["active"] = str(active).lower()
-        if closed is not None:
-            params["closed"] = str(closed).lower()
+        return list(self.iter_markets(
+            limit=limit,
+            offset=offset,
+            active=active,
+            closed=closed,
+            order=order,
+            ascending=ascending,
+            include_raw=include_raw,
+        ))
+
+    def iter_markets(
+        self,
+        *,
+        limit: int = 100,
+        offset: int = 0,
+        active: bool | None = True,
+        closed: bool | None = None,
+        order: str = "volume",
+        ascending: bool = False,
+        include_raw: bool = False,
+    ) -> Iterator[PolymarketMarket]:
+        """
+        Fetch a page of markets from the Gamma API, parsing them lazily.
 
-        resp = self._session.get(
-            f"{self.gamma_host}/markets",
-            params=params,
-            timeout=self.timeout,
-        )
-        resp.raise_for_status()
-        return [self._parse_market(m) for m in resp.json()]
+        Callers that stop early skip parsing the rest of the page.  The raw
+        API dict is only kept on each market when ``include_raw`` is set.
+        """
+        params = _markets_params(limit, offset, active, closed, order, ascending)
+        content = self._get_conditional(f"{self.gamma_host}/markets", params)
+        yield from _parse_markets(content, include_raw)
 
     def get_market_by_slug(self, slug: str) -> PolymarketMarket:
         """Fetch a single market by its URL slug."""
@@ -125,7 +480,7 @@ class PolymarketDataClient:
             timeout=self.timeout,
         )
         resp.raise_for_status()
-        return self._parse_market(resp.json())
+        return self._parse_market(_json_loads(resp.content))
 
     def get_market_by_condition(self, condition_id: str) -> PolymarketMarket:
         """Fetch a single market by its condition ID."""
@@ -134,7 +489,7 @@ class PolymarketDataClient:
             timeout=self.timeout,
         )
         resp.raise_for_status()
-        return self._parse_market(resp.json())
+        return self._parse_market(_json_loads(resp.content))
 
     def get_events(
         self,
@@ -159,13 +514,36 @@ class PolymarketDataClient:
             timeout=self.timeout,
         )
         resp.raise_for_status()
-        return resp.json()
+        return _json_loads(resp.content)
+
+    def search_markets(
+        self,
+        query: str,
+        limit: int = 20,
+        *,
+        page_size: int = 100,
+        max_pages: int = 10,
+    ) -> list[PolymarketMarket]:
+        """
+        Search active markets by keyword in the question text.
 
-    def search_markets(self, query: str, limit: int = 20) -> list[PolymarketMarket]:
-        """Search markets by keyword in the question text."""
-        all_markets = self.get_markets(limit=limit, active=True)
-        q = query.lower()
-        return [m for m in all_markets if q in m.question.lower()]
+        The Gamma ``/markets`` endpoint has no text filter, so pages are
+        fetched (by volume) until ``limit`` matches are found, the results
+        run out, or ``max_pages`` pages have been scanned.
+        """
+        matches_query = re.compile(re.escape(query), re.IGNORECASE).search
+        found: list[PolymarketMarket] = []
+        for page in range(max_pages):
+            n = 0
+            for m in self.iter_markets(limit=page_size, offset=page * page_size, active=True):
+                n += 1
+                if matches_query(m.question):
+                    found.append(m)
+                    if len(found) >= limit:
+                        return found
+            if n < page_size:
+                break
+        return found
 
     # ── CLOB API — historical prices ─────────────────────────────────
 
@@ -179,7 +557,26 @@ class PolymarketDataClient:
         fidelity: int | None = None,
     ) -> list[PricePoint]:
         """
-        Fetch historical price data for a CLOB token.
+        Fetch historical price data for a CLOB token as PricePoint objects.
+
+        See ``get_price_history_arrays`` for the parameters.
+        """
+        return _to_price_points(*self.get_price_history_arrays(
+            token_id, interval=interval, start_ts=start_ts, end_ts=end_ts, fidelity=fidelity,
+        ))
+
+    def get_price_history_arrays(
+        self,
+        token_id: str,
+        *,
+        interval: str | None = None,
+        start_ts: int | None = None,
+        end_ts: int | None = None,
+        fidelity: int | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Fetch historical price data for a CLOB token as column arrays
+        ``(timestamps, prices)`` — int64 unix seconds and float64 prices.
 
         Parameters
         ----------
@@ -195,26 +592,41 @@ class PolymarketDataClient:
         fidelity : int, optional
             Resolution in minutes (e.g. 60 = hourly candles).
         """
-        params: dict[str, Any] = {"market": token_id}
-        if interval is not None:
-            params["interval"] = interval
-        if start_ts is not None:
-            params["startTs"] = start_ts
-        if end_ts is not None:
-            params["endTs"] = end_ts
-        if fidelity is not None:
-            params["fidelity"] = fidelity
-
+        params = _price_history_params(token_id, interval, start_ts, end_ts, fidelity)
         resp = self._session.get(
             f"{self.clob_host}/prices-history",
             params=params,
             timeout=self.timeout,
         )
         resp.raise_for_status()
-        data = resp.json()
+        return _parse_price_history_arrays(_json_loads(resp.content))
+
+    def get_price_histories(
+        self,
+        token_ids: list[str],
+        *,
+        interval: str | None = None,
+        start_ts: int | None = None,
+        end_ts: int | None = None,
+        fidelity: int | None = None,
+    ) -> list[list[PricePoint]]:
+        """
+        Fetch price histories for several tokens concurrently.
 
-        history = data.get("history", [])
-        return [PricePoint(timestamp=pt["t"], price=pt["p"]) for pt in history]
+        Requests run on a small thread pool sharing this client's pooled
+        session, so N tokens cost about one round-trip instead of N.
+        Results are returned in ``token_ids`` order.
+        """
+        if not token_ids:
+            return []
+
+        def fetch(token_id: str) -> list[PricePoint]:
+            return self.get_price_history(
+                token_id, interval=interval, start_ts=start_ts, end_ts=end_ts, fidelity=fidelity,
+            )
+
+        with ThreadPoolExecutor(max_workers=min(len(token_ids), POOL_MAXSIZE)) as pool:
+            return list(pool.map(fetch, token_ids))
 
     def get_price_history_as_bars(
         self,
@@ -222,109 +634,139 @@ class PolymarketDataClient:
         *,
         interval: str = "max",
         fidelity: int = 60,
-    ):
+    ) -> list[Bar]:
         """
         Fetch price history and convert to Bar objects for backtesting.
 
         Returns a list of nautilus_core Bar objects.  Since prediction markets
         don't have true OHLCV, we synthesize them:
-        - open/high/low/close are all the snapshot price
+        - close is the snapshot price and open is the previous close
+        - high/low span the neighbouring snapshot prices
         - volume is set to 0 (not provided by this endpoint)
 
         For higher-fidelity backtesting, use the CLOB order book data
         or trade-tick data instead.
         """
-        from nautilus_core.data import Bar, BarSpecification, BarType
-        from nautilus_core.enums import BarAggregation, PriceType
-        from nautilus_core.identifiers import InstrumentId, Symbol, Venue
-        from nautilus_core.objects import Price, Quantity
-
-        points = self.get_price_history(token_id, interval=interval, fidelity=fidelity)
-        if not points:
+        timestamps, closes = self.get_price_history_arrays(token_id, interval=interval, fidelity=fidelity)
+        if not len(closes):
             return []
 
-        # Create a bar type keyed on the token_id
-        short_id = token_id[:16]  # first 16 chars as symbol
-        instrument_id = InstrumentId(Symbol(short_id), Venue("POLYMARKET"))
-        bar_spec = BarSpecification(fidelity, BarAggregation.MINUTE, PriceType.MID)
-        bar_type = BarType(instrument_id, bar_spec)
+        bar_type = bar_type_for(token_id, fidelity)
+
+        # Approximate the intra-bar range from the adjacent snapshot prices
+        prev = np.concatenate((closes[:1], closes[:-1]))
+        nxt = np.concatenate((closes[1:], closes[-1:]))
+        highs = np.maximum(np.maximum(closes, prev), nxt)
+        lows = np.minimum(np.minimum(closes, prev), nxt)
+
+        # Price/Quantity are immutable, so each close doubles as the next
+        # bar's open and a single zero volume is shared by every bar
+        close_raws, high_raws, low_raws = (
+            price_raws(np.stack((closes, highs, lows))).tolist()
+        )
+        close_pxs = [Price.from_raw(c, PRICE_PRECISION) for c in close_raws]
+        volume = Quantity(0, 0)
 
         bars: list[Bar] = []
-        for i, pt in enumerate(points):
-            px = Price(pt.price, 4)
-            ts_ns = pt.timestamp * 1_000_000_000
+        for i, ts_ns in enumerate((timestamps * 1_000_000_000).tolist()):
+            close_px = close_pxs[i]
+            close_raw = close_raws[i]
+            high_raw = high_raws[i]
+            low_raw = low_raws[i]
             bars.append(Bar(
                 bar_type=bar_type,
-                open=px,
-                high=px,
-                low=px,
-                close=px,
-                volume=Quantity(0, 0),
+                open=close_pxs[i - 1] if i > 0 else close_px,
+                high=close_px if high_raw == close_raw else Price.from_raw(high_raw, PRICE_PRECISION),
+                low=close_px if low_raw == close_raw else Price.from_raw(low_raw, PRICE_PRECISION),
+                close=close_px,
+                volume=volume,
                 ts_event=ts_ns,
                 ts_init=ts_ns,
             ))
 
-        # Improve OHLC by using adjacent points to approximate intra-bar range
-        for i in range(len(bars)):
-            prices = [bars[i].close]
-            if i > 0:
-                prices.append(bars[i - 1].close)
-            if i < len(bars) - 1:
-                prices.append(bars[i + 1].close)
-            high_val = max(p.as_double() for p in prices)
-            low_val = min(p.as_double() for p in prices)
-            bars[i] = Bar(
-                bar_type=bar_type,
-                open=bars[i - 1].close if i > 0 else bars[i].close,
-                high=Price(high_val, 4),
-                low=Price(low_val, 4),
-                close=bars[i].close,
-                volume=Quantity(0, 0),
-                ts_event=bars[i].ts_event,
-                ts_init=bars[i].ts_init,
-            )
-
         return bars
 
     # ── CLOB API — live orderbook / price ─────────────────────────────
 
     def get_midpoint(self, token_id: str) -> float:
-        """Get the current midpoint price for a token."""
-        resp = self._session.get(
-            f"{self.clob_host}/midpoint",
-            params={"token_id": token_id},
-            timeout=self.timeout,
-        )
-        resp.raise_for_status()
-        return float(resp.json().get("mid", 0))
+        """
+        Get the current midpoint price for a token.
+
+        Calls for the same token within ``MIDPOINT_COALESCE_WINDOW`` seconds
+        share one response.  See ``_get_live`` for failure handling.
+        """
+        last = self._last_midpoint.get(token_id)
+        if last is not None and time.monotonic() - last[0] < MIDPOINT_COALESCE_WINDOW:
+            return float(last[1].get("mid", 0))
+        return float(self._get_live("midpoint", token_id, self._last_midpoint).get("mid", 0))
 
     def get_orderbook(self, token_id: str) -> dict:
-        """Get the current order book for a token."""
-        resp = self._session.get(
-            f"{self.clob_host}/book",
-            params={"token_id": token_id},
-            timeout=self.timeout,
-        )
-        resp.raise_for_status()
-        return resp.json()
+        """
+        Get the current order book for a token.
+
+        See ``_get_live`` for failure handling.
+        """
+        return self._get_live("book", token_id, self._last_book)
+
+    def _get_live(self, path: str, token_id: str, last: dict[str, tuple[float, dict]]) -> dict:
+        """
+        GET a live CLOB endpoint behind the circuit breaker.
+
+        Connection errors and 5xx replies count as failures.  When a request
+        fails, or the circuit is open, the last response for the token is
+        returned if it is at most ``LIVE_STALE_TTL`` seconds old; otherwise
+        the error (or ``CircuitOpenError``) is raised.
+        """
+        breaker = self._live_breaker
+        if not breaker.allow():
+            error: Exception = CircuitOpenError(
+                f"CLOB requests suspended after {breaker.fail_max} consecutive failures"
+            )
+        else:
+            try:
+                resp = self._session.get(
+                    f"{self.clob_host}/{path}",
+                    params={"token_id": token_id},
+                    timeout=self.timeout,
+                )
+                resp.raise_for_status()
+            except requests.HTTPError as e:
+                if e.response is None or e.response.status_code < 500:
+                    breaker.record_abort()
+                    raise
+                breaker.record_failure()
+                error = e
+            except requests.RequestException as e:
+                breaker.record_failure()
+                error = e
+            else:
+                breaker.record_success()
+                data = _json_loads(resp.content)
+                last[token_id] = (time.monotonic(), data)
+                return data
+
+        cached = last.get(token_id)
+        if cached is not None and time.monotonic() - cached[0] <= LIVE_STALE_TTL:
+            return cached[1]
+        raise error
 
     # ── Internal ──────────────────────────────────────────────────────
 
     @staticmethod
-    def _parse_market(raw: dict) -> PolymarketMarket:
+    def _parse_market(raw: dict, include_raw: bool = False) -> PolymarketMarket:
         """Parse a raw Gamma API market dict into a PolymarketMarket."""
         outcomes = raw.get("outcomes", "[]")
         if isinstance(outcomes, str):
-            outcomes = json.loads(outcomes)
+            outcomes = _json_loads(outcomes)
 
         outcome_prices = raw.get("outcomePrices", "[]")
         if isinstance(outcome_prices, str):
-            outcome_prices = json.loads(outcome_prices)
+            outcome_prices = _json_loads(outcome_prices)
         outcome_prices = [float(p) for p in outcome_prices]
 
         clob_token_ids = raw.get("clobTokenIds", "[]")
         if isinstance(clob_token_ids, str):
-            clob_token_ids = json.loads(clob_token_ids)
+            clob_token_ids = _json_loads(clob_token_ids)
 
         return PolymarketMarket(
             condition_id=raw.get("conditionId", raw.get("condition_id", "")),
@@ -339,5 +781,177 @@ class PolymarketDataClient:
             liquidity=float(raw.get("liquidityNum", raw.get("liquidity", 0)) or 0),
             end_date=raw.get("endDate", ""),
             description=raw.get("description", ""),
-            raw=raw,
+            raw=raw if include_raw else None,
+        )
+
+
+class AsyncPolymarketDataClient:
+    """
+    Async read-only client for Polymarket market data.
+
+    Uses a single ``httpx.AsyncClient`` with HTTP/2, so concurrent requests
+    (e.g. ``get_many_orderbooks``) are multiplexed over one connection
+    instead of paying a round-trip each.  Install it with::
+
+        pip install "httpx[http2]"
+    """
+
+    def __init__(
+        self,
+        gamma_host: str = GAMMA_HOST,
+        clob_host: str = CLOB_HOST,
+        request_timeout: int = 30,
+        max_connections: int = 32,
+    ) -> None:
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError(
+                "httpx is required for the async data client.\n"
+                'Install it with:  pip install "httpx[http2]"'
+            )
+
+        self.gamma_host = gamma_host.rstrip("/")
+        self.clob_host = clob_host.rstrip("/")
+        self.timeout = request_timeout
+        self._client = httpx.AsyncClient(
+            timeout=request_timeout,
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_connections=max_connections),
+                retries=MAX_RETRIES,
+            ),
         )
+
+    async def __aenter__(self) -> AsyncPolymarketDataClient:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def _get(self, url: str, params: dict[str, Any] | None = None) -> Any:
+        return _json_loads(await self._get_content(url, params))
+
+    async def _get_content(self, url: str, params: dict[str, Any] | None = None) -> bytes:
+        # The transport only retries failed connects; 5xx are retried here
+        for attempt in range(MAX_RETRIES + 1):
+            resp = await self._client.get(url, params=params)
+            if resp.status_code not in RETRY_STATUS_CODES or attempt == MAX_RETRIES:
+                break
+            delay = min(RETRY_BACKOFF * 2 ** attempt, RETRY_BACKOFF_MAX)
+            await asyncio.sleep(delay + random.uniform(0, RETRY_BACKOFF))
+        resp.raise_for_status()
+        return resp.content
+
+    # ── Gamma API — market discovery ──────────────────────────────────
+
+    async def get_markets(
+        self,
+        *,
+        limit: int = 100,
+        offset: int = 0,
+        active: bool | None = True,
+        closed: bool | None = None,
+        order: str = "volume",
+        ascending: bool = False,
+        include_raw: bool = False,
+    ) -> list[PolymarketMarket]:
+        """Fetch a page of markets from the Gamma API."""
+        params = _markets_params(limit, offset, active, closed, order, ascending)
+        content = await self._get_content(f"{self.gamma_host}/markets", params)
+        return list(_parse_markets(content, include_raw))
+
+    async def get_market_by_slug(self, slug: str) -> PolymarketMarket:
+        """Fetch a single market by its URL slug."""
+        data = await self._get(f"{self.gamma_host}/markets/slug/{slug}")
+        return PolymarketDataClient._parse_market(data)
+
+    async def search_markets(
+        self,
+        query: str,
+        limit: int = 20,
+        *,
+        page_size: int = 100,
+        max_pages: int = 10,
+    ) -> list[PolymarketMarket]:
+        """
+        Search active markets by keyword in the question text.
+
+        Unlike the sync client, all ``max_pages`` pages are requested at
+        once, so a full scan costs about one round-trip.  Matches are
+        returned in the same (volume) order as the sync client.
+        """
+        pages = await asyncio.gather(*(
+            self.get_markets(limit=page_size, offset=page * page_size, active=True)
+            for page in range(max_pages)
+        ))
+        matches_query = re.compile(re.escape(query), re.IGNORECASE).search
+        found = [m for markets in pages for m in markets if matches_query(m.question)]
+        return found[:limit]
+
+    # ── CLOB API ──────────────────────────────────────────────────────
+
+    async def get_price_history(
+        self,
+        token_id: str,
+        *,
+        interval: str | None = None,
+        start_ts: int | None = None,
+        end_ts: int | None = None,
+        fidelity: int | None = None,
+    ) -> list[PricePoint]:
+        """Fetch historical price data for a CLOB token."""
+        return _to_price_points(*await self.get_price_history_arrays(
+            token_id, interval=interval, start_ts=start_ts, end_ts=end_ts, fidelity=fidelity,
+        ))
+
+    async def get_price_history_arrays(
+        self,
+        token_id: str,
+        *,
+        interval: str | None = None,
+        start_ts: int | None = None,
+        end_ts: int | None = None,
+        fidelity: int | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Fetch historical price data for a CLOB token as (timestamps, prices) arrays."""
+        params = _price_history_params(token_id, interval, start_ts, end_ts, fidelity)
+        data = await self._get(f"{self.clob_host}/prices-history", params)
+        return _parse_price_history_arrays(data)
+
+    async def get_midpoint(self, token_id: str) -> float:
+        """Get the current midpoint price for a token."""
+        data = await self._get(f"{self.clob_host}/midpoint", {"token_id": token_id})
+        return float(data.get("mid", 0))
+
+    async def get_orderbook(self, token_id: str) -> dict:
+        """Get the current order book for a token."""
+        return await self._get(f"{self.clob_host}/book", {"token_id": token_id})
+
+    async def get_many_midpoints(self, token_ids: list[str]) -> list[float]:
+        """Fetch midpoints for several tokens concurrently."""
+        return await asyncio.gather(*(self.get_midpoint(t) for t in token_ids))
+
+    async def get_many_orderbooks(self, token_ids: list[str]) -> list[dict]:
+        """Fetch order books for several tokens concurrently."""
+        return await asyncio.gather(*(self.get_orderbook(t) for t in token_ids))
+
+    async def get_many_price_histories(
+        self,
+        token_ids: list[str],
+        *,
+        interval: str | None = None,
+        start_ts: int | None = None,
+        end_ts: int | None = None,
+        fidelity: int | None = None,
+    ) -> list[list[PricePoint]]:
+        """Fetch price histories for several tokens concurrently."""
+        return await asyncio.gather(*(
+            self.get_price_history(
+                t, interval=interval, start_ts=start_ts, end_ts=end_ts, fidelity=fidelity,
+            )
+            for t in token_ids
+        ))
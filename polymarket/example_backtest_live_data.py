@@ -17,7 +17,6 @@ from __future__ import annotations
 import argparse
 import os
 import sys
-from decimal import Decimal
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -9,49 +9,71 @@ Run:
 from __future__ import annotations
 
 import os
-import random
 import sys
 from decimal import Decimal
 
+import numpy as np
+
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from nautilus_core.backtest.engine import BacktestEngine
 from nautilus_core.data import Bar, BarSpecification, BarType
 from nautilus_core.enums import AccountType, BarAggregation, OmsType, PriceType
+from nautilus_core.jit import njit
 from nautilus_core.objects import Money, Price, Quantity
 
-from polymarket.instruments import USDC, PredictionMarketOutcome
+from polymarket.instruments import PRICE_PRECISION, USDC, PredictionMarketOutcome, price_raws
 from polymarket.strategies import MeanReversionConfig, MeanReversionStrategy
 
 
-def generate_ou_bars(instrument_id, num_bars=500, mu=0.55, theta=0.02, sigma=0.03, seed=42):
+@njit(cache=True)
+def _simulate_ou(n, mu, theta, sigma, start, seed):
+    """Simulate OU open/high/low/close paths as float64 arrays."""
+    np.random.seed(seed)
+    opens = np.empty(n)
+    highs = np.empty(n)
+    lows = np.empty(n)
+    closes = np.empty(n)
+    wick = sigma * 0.3
+    price = start
+    for i in range(n):
+        dp = theta * (mu - price) + sigma * np.random.normal(0.0, 1.0)
+        new_price = max(0.02, min(0.98, price + dp))
+        opens[i] = price
+        highs[i] = min(0.99, max(price, new_price) + abs(np.random.normal(0.0, wick)))
+        lows[i] = max(0.01, min(price, new_price) - abs(np.random.normal(0.0, wick)))
+        closes[i] = new_price
+        price = new_price
+    return opens, highs, lows, closes
+
+
+def generate_ou_bars(instrument_id, num_bars=500, mu=0.55, theta=0.02, sigma=0.03, start=0.50, seed=42):
     """Generate Ornstein-Uhlenbeck process bars (mean-reverting probabilities)."""
-    random.seed(seed)
     bar_spec = BarSpecification(60, BarAggregation.MINUTE, PriceType.MID)
     bar_type = BarType(instrument_id, bar_spec)
     base_ts = 1_700_000_000 * 1_000_000_000
 
-    bars = []
-    price = 0.50
-    for i in range(num_bars):
-        dp = theta * (mu - price) + sigma * random.gauss(0, 1)
-        new_price = max(0.02, min(0.98, price + dp))
-
-        high_px = min(0.99, max(price, new_price) + abs(random.gauss(0, sigma * 0.3)))
-        low_px = max(0.01, min(price, new_price) - abs(random.gauss(0, sigma * 0.3)))
-        ts = base_ts + i * 3_600_000_000_000
+    ohlc = np.stack(_simulate_ou(num_bars, mu, theta, sigma, start, seed))
+    # Integer price ticks, so Price skips the float -> str -> Decimal path
+    opens, highs, lows, closes = price_raws(ohlc).tolist()
+    volume = Quantity(0, 0)
 
-        bars.append(Bar(
+    bars = [
+        Bar(
             bar_type=bar_type,
-            open=Price(price, 4),
-            high=Price(high_px, 4),
-            low=Price(low_px, 4),
-            close=Price(new_price, 4),
-            volume=Quantity(0, 0),
+            open=Price.from_raw(o, PRICE_PRECISION),
+            high=Price.from_raw(h, PRICE_PRECISION),
+            low=Price.from_raw(lo, PRICE_PRECISION),
+            close=Price.from_raw(c, PRICE_PRECISION),
+            volume=volume,
             ts_event=ts,
             ts_init=ts,
-        ))
-        price = new_price
+        )
+        for o, h, lo, c, ts in zip(
+            opens, highs, lows, closes,
+            range(base_ts, base_ts + num_bars * 3_600_000_000_000, 3_600_000_000_000),
+        )
+    ]
 
     return bars, bar_type
 
@@ -67,7 +89,7 @@ def main():
         token_id=token_id,
         market_question="Will BTC exceed $200k by end of 2026?",
         outcome_label="Yes",
-        price_precision=4,
+        price_precision=PRICE_PRECISION,
         size_precision=2,
     )
 
@@ -89,7 +111,7 @@ def main():
 
     # Strategy
     config = MeanReversionConfig(
-        instrument_id=str(instrument.id),
+        instrument_id=instrument.id,
         sma_period=20,
         entry_threshold=0.05,
         exit_threshold=0.02,
@@ -18,6 +18,8 @@ from __future__ import annotations
 
 import os
 import sys
+from itertools import zip_longest
+from operator import itemgetter
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -89,9 +91,10 @@ ERROR: No credentials configured.
     asks = book.get("asks", [])[:3]
     print(f"\n  Order Book (top 3):")
     print(f"    {'BIDS':>20s}  |  {'ASKS':<20s}")
-    for i in range(max(len(bids), len(asks))):
-        bid_str = f"{bids[i]['price']} x {bids[i]['size']}" if i < len(bids) else ""
-        ask_str = f"{asks[i]['price']} x {asks[i]['size']}" if i < len(asks) else ""
+    price_size = itemgetter("price", "size")
+    bid_strs = [f"{p} x {s}" for p, s in map(price_size, bids)]
+    ask_strs = [f"{p} x {s}" for p, s in map(price_size, asks)]
+    for bid_str, ask_str in zip_longest(bid_strs, ask_strs, fillvalue=""):
         print(f"    {bid_str:>20s}  |  {ask_str:<20s}")
 
     # ── Show open orders ─────────────────────────────────────────────
@@ -8,11 +8,15 @@ probability.
 from __future__ import annotations
 
 from decimal import Decimal
+from functools import lru_cache
 
-from nautilus_core.enums import AssetClass
+import numpy as np
+
+from nautilus_core.data import BarSpecification, BarType
+from nautilus_core.enums import AssetClass, BarAggregation, PriceType
 from nautilus_core.identifiers import InstrumentId, Symbol, Venue
 from nautilus_core.instruments import Instrument
-from nautilus_core.objects import USDT, Currency, Price, Quantity
+from nautilus_core.objects import USDT, Currency, Price, Quantity, raw_half_up
 
 
 # Polymarket settles in USDC on Polygon, but for our model we use USDT
@@ -22,6 +26,63 @@ USDC = Currency("USDC", 2, USDT.currency_type)
 
 POLYMARKET_VENUE = Venue("POLYMARKET")
 
+# Prices are quoted to 4 decimals, so bar prices are handled as integer
+# ticks of 1 / PRICE_SCALE and only become Price objects via from_raw
+PRICE_PRECISION = 4
+PRICE_SCALE = 10 ** PRICE_PRECISION
+
+
+def price_raws(prices: np.ndarray) -> np.ndarray:
+    """
+    Integer price ticks for an array of float prices.
+
+    Rounds exactly as ``Price(p, PRICE_PRECISION)`` does (half up on the
+    decimal repr).  The bulk is rounded vectorized; only prices within
+    float error of a half tick go through ``raw_half_up``.
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    scaled = prices * PRICE_SCALE
+    raws = np.floor(scaled + 0.5)
+    near_half = np.abs(np.abs(scaled - raws) - 0.5) <= 1e-9 + np.abs(scaled) * 1e-12
+    raws = raws.astype(np.int64)
+    for idx in zip(*np.nonzero(near_half)):
+        raws[idx] = raw_half_up(float(prices[idx]), PRICE_PRECISION)
+    return raws
+
+
+# Price/Quantity are immutable, so one instance per precision is shared
+# by every instrument instead of redoing the Decimal math each time.
+
+@lru_cache(maxsize=16)
+def _price_increment(precision: int) -> Price:
+    return Price.from_raw(1, precision)
+
+
+@lru_cache(maxsize=16)
+def _size_increment(precision: int) -> Quantity:
+    return Quantity(Decimal(10) ** -precision, precision)
+
+
+@lru_cache(maxsize=16)
+def _price_bounds(precision: int) -> tuple[Price, Price]:
+    return Price("0.01", precision), Price("0.99", precision)
+
+
+# Identifiers are immutable too, so repeat lookups for the same token
+# (instrument creation, bar loading) reuse the same objects.
+
+@lru_cache(maxsize=1024)
+def instrument_id_for(token_id: str) -> InstrumentId:
+    """Instrument ID for a token, using a shortened token ID as the symbol."""
+    return InstrumentId(Symbol(token_id[:16]), POLYMARKET_VENUE)
+
+
+@lru_cache(maxsize=1024)
+def bar_type_for(token_id: str, fidelity: int) -> BarType:
+    """Mid-price minute bar type of ``fidelity`` minutes for a token."""
+    bar_spec = BarSpecification(fidelity, BarAggregation.MINUTE, PriceType.MID)
+    return BarType(instrument_id_for(token_id), bar_spec)
+
 
 class PredictionMarketOutcome(Instrument):
     """
@@ -31,21 +92,21 @@ class PredictionMarketOutcome(Instrument):
     Each share pays $1.00 if the outcome resolves YES, $0.00 otherwise.
     """
 
+    __slots__ = ("token_id", "market_question", "outcome_label")
+
     def __init__(
         self,
         token_id: str,
         market_question: str,
         outcome_label: str,
         *,
-        price_precision: int = 4,
+        price_precision: int = PRICE_PRECISION,
         size_precision: int = 2,
         maker_fee: Decimal = Decimal("0"),
         taker_fee: Decimal = Decimal("0"),
     ) -> None:
-        # Use a shortened token ID as the symbol for readability
-        short_id = token_id[:16]
-        symbol = Symbol(short_id)
-        instrument_id = InstrumentId(symbol, POLYMARKET_VENUE)
+        instrument_id = instrument_id_for(token_id)
+        min_price, max_price = _price_bounds(price_precision)
 
         super().__init__(
             instrument_id=instrument_id,
@@ -53,10 +114,10 @@ class PredictionMarketOutcome(Instrument):
             quote_currency=USDC,
             price_precision=price_precision,
             size_precision=size_precision,
-            price_increment=Price(Decimal(10) ** -price_precision, price_precision),
-            size_increment=Quantity(Decimal(10) ** -size_precision, size_precision),
-            min_price=Price("0.01", price_precision),
-            max_price=Price("0.99", price_precision),
+            price_increment=_price_increment(price_precision),
+            size_increment=_size_increment(size_precision),
+            min_price=min_price,
+            max_price=max_price,
             maker_fee=maker_fee,
             taker_fee=taker_fee,
         )
@@ -97,3 +158,16 @@ def create_instruments_from_market(market) -> tuple[PredictionMarketOutcome, Pre
         outcome_label=market.outcomes[1] if len(market.outcomes) > 1 else "No",
     )
     return yes, no
+
+
+def create_instruments_bulk(markets) -> list[PredictionMarketOutcome]:
+    """
+    Create (YES, NO) instruments for many markets at once.
+
+    Returns a flat list ``[yes_0, no_0, yes_1, no_1, ...]`` of length
+    ``2 * len(markets)``.
+    """
+    instruments: list[PredictionMarketOutcome] = []
+    for market in markets:
+        instruments.extend(create_instruments_from_market(market))
+    return instruments
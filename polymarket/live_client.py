@@ -9,12 +9,52 @@ GitHub:    https://github.com/Polymarket/py-clob-client
 from __future__ import annotations
 
 import os
+import socket
 from dataclasses import dataclass
-from decimal import Decimal
-from typing import Any
 
-
-@dataclass
+try:
+    from py_clob_client.client import ClobClient
+    from py_clob_client.clob_types import (
+        ApiCreds,
+        MarketOrderArgs,
+        OpenOrderParams,
+        OrderArgs,
+        OrderType,
+    )
+    from py_clob_client.order_builder.constants import BUY, SELL
+
+    _ORDER_TYPES = {
+        "GTC": OrderType.GTC,
+        "FOK": OrderType.FOK,
+        "GTD": OrderType.GTD,
+        "FAK": OrderType.FAK,
+    }
+    _SIDES = {"BUY": BUY, "SELL": SELL}
+    _CLOB_IMPORT_ERROR = None
+except ImportError as e:  # checked in PolymarketLiveClient.connect()
+    ClobClient = None
+    _CLOB_IMPORT_ERROR = e
+
+# Older py-clob-client releases have no batch endpoint; checked in place_batch()
+try:
+    from py_clob_client.clob_types import PostOrdersArgs
+except ImportError:
+    PostOrdersArgs = None
+
+# The keep-alive client is an optimisation: without httpx or the private
+# helpers module, ClobClient keeps its own default HTTP client
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    from py_clob_client.http_helpers import helpers as _clob_http
+except ImportError:
+    _clob_http = None
+
+
+@dataclass(slots=True, frozen=True)
 class PolymarketOrder:
     """Local representation of a placed order."""
     order_id: str
@@ -22,11 +62,21 @@ class PolymarketOrder:
     side: str      # "BUY" or "SELL"
     price: float
     size: float
-    order_type: str  # "GTC", "FOK", "GTD"
-    status: str
+    order_type: str  # "GTC", "FOK", "GTD", "FAK"
+    status: str      # frozen: use dataclasses.replace() for a new status
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class OrderSpec:
+    """A limit order to submit as part of a batch (see ``place_batch``)."""
+    token_id: str
+    side: str      # "BUY" or "SELL"
+    price: float
+    size: float
+    order_type: str = "GTC"
+
+
+@dataclass(slots=True, frozen=True)
 class PolymarketPosition:
     """A position in a prediction market outcome."""
     token_id: str
@@ -36,6 +86,66 @@ class PolymarketPosition:
     market_question: str = ""
 
 
+# Maximum number of orders the CLOB accepts in one batch request
+MAX_BATCH_ORDERS = 15
+
+# Idle CLOB connections are kept open this long (seconds) so orders spaced
+# further apart than httpx's 5s default still reuse a warm TLS connection
+KEEPALIVE_EXPIRY = 300.0
+MAX_KEEPALIVE_CONNECTIONS = 10
+HTTP_TIMEOUT = 5.0
+# Failed connection attempts are retried; requests that reached the server
+# are not, since re-posting an order could place it twice
+CONNECT_RETRIES = 3
+
+_keepalive_client = None
+
+
+def _order_type(order_type: str):
+    try:
+        return _ORDER_TYPES[order_type]
+    except KeyError:
+        raise ValueError(
+            f"Unknown order type {order_type!r}, expected one of {', '.join(_ORDER_TYPES)}"
+        ) from None
+
+
+def _side(side: str):
+    try:
+        return _SIDES[side]
+    except KeyError:
+        raise ValueError(f"Unknown side {side!r}, expected one of {', '.join(_SIDES)}") from None
+
+
+def _install_keepalive_http_client() -> None:
+    """
+    Swap py-clob-client's module-level HTTP/2 client for one that keeps idle
+    connections alive longer, retries failed connects and disables Nagle.
+    Every ClobClient request goes through it.
+    """
+    global _keepalive_client
+    if httpx is None or _clob_http is None:
+        return
+    current = getattr(_clob_http, "_http_client", None)
+    if current is None or current is _keepalive_client:
+        return  # unknown py-clob-client layout, or already installed
+    _keepalive_client = httpx.Client(
+        timeout=HTTP_TIMEOUT,
+        transport=httpx.HTTPTransport(
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=KEEPALIVE_EXPIRY,
+            ),
+            retries=CONNECT_RETRIES,
+            # Small signed-order bodies go out immediately instead of waiting on Nagle
+            socket_options=[(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)],
+        ),
+    )
+    current.close()
+    _clob_http._http_client = _keepalive_client
+
+
 class PolymarketLiveClient:
     """
     Authenticated trading client for Polymarket.
@@ -74,13 +184,12 @@ class PolymarketLiveClient:
 
     def connect(self) -> None:
         """Initialize the py-clob-client and derive API credentials."""
-        try:
-            from py_clob_client.client import ClobClient
-        except ImportError:
+        if ClobClient is None:
             raise ImportError(
-                "py-clob-client is required for live trading.\n"
+                f"py-clob-client is required for live trading "
+                f"(could not import {_CLOB_IMPORT_ERROR.name or 'py_clob_client'}: {_CLOB_IMPORT_ERROR}).\n"
                 "Install it with:  pip install py-clob-client"
-            )
+            ) from _CLOB_IMPORT_ERROR
 
         if not self._private_key:
             raise ValueError(
@@ -95,6 +204,7 @@ class PolymarketLiveClient:
             signature_type=self._signature_type,
             funder=self._wallet_address or None,
         )
+        _install_keepalive_http_client()
 
         # Check if pre-set API creds exist in env
         api_key = os.environ.get("POLYMARKET_API_KEY")
@@ -102,7 +212,6 @@ class PolymarketLiveClient:
         api_passphrase = os.environ.get("POLYMARKET_API_PASSPHRASE")
 
         if api_key and api_secret and api_passphrase:
-            from py_clob_client.clob_types import ApiCreds
             self._client.set_api_creds(ApiCreds(
                 api_key=api_key,
                 api_secret=api_secret,
@@ -133,9 +242,6 @@ class PolymarketLiveClient:
         amount : float
             The USDC amount to spend.
         """
-        from py_clob_client.clob_types import MarketOrderArgs, OrderType
-        from py_clob_client.order_builder.constants import BUY
-
         args = MarketOrderArgs(
             token_id=token_id,
             amount=amount,
@@ -147,9 +253,6 @@ class PolymarketLiveClient:
 
     def sell_market(self, token_id: str, amount: float) -> dict:
         """Place a market SELL order (fill-or-kill)."""
-        from py_clob_client.clob_types import MarketOrderArgs, OrderType
-        from py_clob_client.order_builder.constants import SELL
-
         args = MarketOrderArgs(
             token_id=token_id,
             amount=amount,
@@ -174,12 +277,9 @@ class PolymarketLiveClient:
         size : float
             Number of shares.
         order_type : str
-            "GTC" (default), "FOK", or "GTD".
+            "GTC" (default), "FOK", "GTD", or "FAK".
         """
-        from py_clob_client.clob_types import OrderArgs, OrderType
-        from py_clob_client.order_builder.constants import BUY
-
-        ot = getattr(OrderType, order_type)
+        ot = _order_type(order_type)
         args = OrderArgs(token_id=token_id, price=price, size=size, side=BUY)
         signed = self.client.create_order(args)
         return self.client.post_order(signed, ot)
@@ -188,25 +288,66 @@ class PolymarketLiveClient:
         self, token_id: str, price: float, size: float, order_type: str = "GTC"
     ) -> dict:
         """Place a limit SELL order."""
-        from py_clob_client.clob_types import OrderArgs, OrderType
-        from py_clob_client.order_builder.constants import SELL
-
-        ot = getattr(OrderType, order_type)
+        ot = _order_type(order_type)
         args = OrderArgs(token_id=token_id, price=price, size=size, side=SELL)
         signed = self.client.create_order(args)
         return self.client.post_order(signed, ot)
 
+    def place_batch(self, specs: list[OrderSpec]) -> list[dict]:
+        """
+        Sign and submit several limit orders in as few requests as possible.
+
+        Orders are signed locally, then posted ``MAX_BATCH_ORDERS`` at a time
+        through the CLOB batch endpoint instead of one request per order.
+
+        Parameters
+        ----------
+        specs : list[OrderSpec]
+            The orders to place.
+
+        Returns
+        -------
+        list[dict]
+            One response per order, in the order of ``specs``.
+        """
+        if PostOrdersArgs is None:
+            raise ImportError(
+                "place_batch needs py_clob_client.clob_types.PostOrdersArgs.\n"
+                "Upgrade it with:  pip install -U py-clob-client"
+            )
+        # Reject a bad side or order type before anything is signed or posted
+        resolved = [(spec, _side(spec.side), _order_type(spec.order_type)) for spec in specs]
+        results: list[dict] = []
+        for start in range(0, len(resolved), MAX_BATCH_ORDERS):
+            batch = [
+                PostOrdersArgs(
+                    order=self.client.create_order(OrderArgs(
+                        token_id=spec.token_id,
+                        price=spec.price,
+                        size=spec.size,
+                        side=side,
+                    )),
+                    orderType=order_type,
+                )
+                for spec, side, order_type in resolved[start:start + MAX_BATCH_ORDERS]
+            ]
+            results.extend(self.client.post_orders(batch))
+        return results
+
     def cancel_order(self, order_id: str) -> dict:
         """Cancel a single open order."""
         return self.client.cancel(order_id)
 
+    def cancel_batch(self, order_ids: list[str]) -> dict:
+        """Cancel several open orders with a single request."""
+        return self.client.cancel_orders(order_ids)
+
     def cancel_all_orders(self) -> dict:
         """Cancel all open orders."""
         return self.client.cancel_all()
 
     def get_open_orders(self) -> list[dict]:
         """Get all open orders for this account."""
-        from py_clob_client.clob_types import OpenOrderParams
         return self.client.get_orders(OpenOrderParams())
 
     # ── Account info ──────────────────────────────────────────────────
@@ -8,39 +8,133 @@ These demonstrate common prediction-market trading patterns:
 """
 from __future__ import annotations
 
-from nautilus_core.data import Bar, BarType
-from nautilus_core.enums import OrderSide
+from dataclasses import dataclass, field
+from functools import partial
+
+import numpy as np
+
+from nautilus_core.data import Bar
+from nautilus_core.enums import OrderSide, TimeInForce
+from nautilus_core.events import PositionChanged, PositionClosed, PositionOpened
 from nautilus_core.identifiers import InstrumentId
-from nautilus_core.indicators.ema import ExponentialMovingAverage
 from nautilus_core.indicators.sma import SimpleMovingAverage
+from nautilus_core.instruments import Instrument
 from nautilus_core.objects import Quantity
 from nautilus_core.trading.config import StrategyConfig
 from nautilus_core.trading.strategy import Strategy
 
+from polymarket._kernels import SIGNAL_BUY, replay_long_only
+
+try:  # native kernels built by `python -m polymarket._kernels_aot`
+    from polymarket._signal_kernels import mean_rev_signal, momentum_signal, value_signal
+except ImportError:
+    from polymarket._kernels import mean_rev_signal, momentum_signal, value_signal
+
+
+# ---------------------------------------------------------------------------
+# Shared base
+# ---------------------------------------------------------------------------
+
+class _SingleInstrumentStrategy(Strategy):
+    """
+    Plumbing shared by the strategies below.
+
+    Each trades a single instrument with a fixed order size.  The instrument
+    and order quantity are resolved once in ``on_start``, and the position
+    direction is tracked from this strategy's position events, so the bar
+    handler doesn't query the cache or portfolio on every bar.
+
+    Subclasses implement ``on_bar_fast(ts, close)``, which works on plain
+    ints/floats and can also be driven straight from columnar arrays.
+    """
+
+    __slots__ = ("_config", "instrument_id", "_instrument", "_pos_state", "_qty", "_market_buy")
+
+    def __init__(self, config: StrategyConfig) -> None:
+        super().__init__(config)
+        self._config = config
+        self.instrument_id: InstrumentId | None = None
+        self._instrument: Instrument | None = None
+        self._pos_state = 0  # 0 = flat, 1 = long, -1 = short
+        self._qty: Quantity | None = None
+        self._market_buy = None
+
+    def on_start(self) -> None:
+        instrument_id = self._config.instrument_id
+        if not isinstance(instrument_id, InstrumentId):
+            instrument_id = InstrumentId.from_str(instrument_id)
+        self.instrument_id = instrument_id
+        self._instrument = self.cache.instrument(self.instrument_id)
+        if self._instrument is None:
+            raise ValueError(f"No instrument found for {self.instrument_id}, add it before starting")
+        self._qty = self._instrument.make_qty(self._config.trade_size)
+        # Each order still needs its own client order id, so bind everything
+        # but the timestamp instead of reusing an order object
+        self._market_buy = partial(
+            self.order_factory.market,
+            self.instrument_id,
+            OrderSide.BUY,
+            self._qty,
+            TimeInForce.GTC,
+        )
+
+    def on_reset(self) -> None:
+        self._pos_state = 0
+
+    def on_bar(self, bar: Bar) -> None:
+        self.on_bar_fast(bar.ts_event, bar.close.as_double())
+
+    def on_bar_fast(self, ts: int, close: float) -> None:
+        """Handle a bar given only its event timestamp (ns) and close price."""
+
+    def on_position_opened(self, event: PositionOpened) -> None:
+        self._update_pos_state(event)
+
+    def on_position_changed(self, event: PositionChanged) -> None:
+        self._update_pos_state(event)
+
+    def on_position_closed(self, event: PositionClosed) -> None:
+        self._update_pos_state(event)
+
+    def _update_pos_state(self, event: PositionOpened | PositionChanged | PositionClosed) -> None:
+        if event.instrument_id == self.instrument_id:
+            signed_qty = event.signed_qty
+            self._pos_state = (signed_qty > 0) - (signed_qty < 0)
+
+
+def _act_hold(strategy: _SingleInstrumentStrategy, ts: int) -> None:
+    pass
+
+
+def _act_buy(strategy: _SingleInstrumentStrategy, ts: int) -> None:
+    strategy.submit_order(strategy._market_buy(ts))
+
+
+def _act_close(strategy: _SingleInstrumentStrategy, ts: int) -> None:
+    strategy.close_all_positions(strategy.instrument_id, ts_init=ts)
+
+
+# Indexed by the signal a kernel returns (SIGNAL_HOLD, SIGNAL_BUY,
+# SIGNAL_CLOSE), so on_bar_fast dispatches with a tuple lookup instead
+# of an if/elif chain
+_ACTIONS = (_act_hold, _act_buy, _act_close)
+
 
 # ---------------------------------------------------------------------------
 # 1.  Mean-Reversion Strategy
 # ---------------------------------------------------------------------------
 
+@dataclass(frozen=True, slots=True)
 class MeanReversionConfig(StrategyConfig):
-    def __init__(
-        self,
-        instrument_id: str,
-        sma_period: int = 20,
-        entry_threshold: float = 0.05,
-        exit_threshold: float = 0.02,
-        trade_size: float = 50.0,
-        strategy_id: str = "MeanReversion",
-    ) -> None:
-        super().__init__(strategy_id=strategy_id)
-        self.instrument_id_str = instrument_id
-        self.sma_period = sma_period
-        self.entry_threshold = entry_threshold  # buy when price < sma - threshold
-        self.exit_threshold = exit_threshold    # sell when price > sma + threshold
-        self.trade_size = trade_size
-
-
-class MeanReversionStrategy(Strategy):
+    instrument_id: InstrumentId | str
+    sma_period: int = 20
+    entry_threshold: float = 0.05  # buy when price < sma - threshold
+    exit_threshold: float = 0.02   # sell when price > sma + threshold
+    trade_size: float = 50.0
+    strategy_id: str = field(default="MeanReversion", kw_only=True)
+
+
+class MeanReversionStrategy(_SingleInstrumentStrategy):
     """
     Buy when the outcome price drops below its moving average by a threshold.
     Sell when price reverts back above the mean.
@@ -49,67 +143,54 @@ class MeanReversionStrategy(Strategy):
     sentiment swings push prices away from fair value.
     """
 
+    __slots__ = ("sma", "_entry_threshold", "_exit_threshold")
+
     def __init__(self, config: MeanReversionConfig) -> None:
         super().__init__(config)
-        self._config = config
-        self.instrument_id: InstrumentId | None = None
         self.sma = SimpleMovingAverage(config.sma_period)
 
     def on_start(self) -> None:
-        self.instrument_id = InstrumentId.from_str(self._config.instrument_id_str)
+        super().on_start()
+        # Config is read once here; on_bar_fast only touches these attributes
+        self._entry_threshold = self._config.entry_threshold
+        self._exit_threshold = self._config.exit_threshold
 
-    def on_bar(self, bar: Bar) -> None:
-        self.sma.handle_bar(bar)
+    def on_bar_fast(self, ts: int, close: float) -> None:
+        self.sma.update_raw(close)
         if not self.sma.initialized:
             return
 
-        instrument = self.cache.instrument(self.instrument_id)
-        if instrument is None:
-            return
-
-        price = bar.close.as_double()
         mean = self.sma.value
-        qty = instrument.make_qty(self._config.trade_size)
-
-        is_flat = self.portfolio.is_flat(self.instrument_id)
-        is_long = self.portfolio.is_net_long(self.instrument_id)
+        is_flat = self._pos_state == 0
+        is_long = self._pos_state > 0
+        signal = mean_rev_signal(
+            close,
+            mean,
+            self._entry_threshold,
+            self._exit_threshold,
+            is_flat,
+            is_long,
+        )
 
         # Entry: price significantly below mean → buy
-        if is_flat and price < mean - self._config.entry_threshold:
-            order = self.order_factory.market(
-                instrument_id=self.instrument_id,
-                side=OrderSide.BUY,
-                quantity=qty,
-                ts_init=bar.ts_event,
-            )
-            self.submit_order(order)
-
         # Exit: price reverts above mean → sell
-        elif is_long and price > mean + self._config.exit_threshold:
-            self.close_all_positions(self.instrument_id, ts_init=bar.ts_event)
+        _ACTIONS[signal](self, ts)
 
 
 # ---------------------------------------------------------------------------
 # 2.  Momentum Strategy (EMA crossover)
 # ---------------------------------------------------------------------------
 
+@dataclass(frozen=True, slots=True)
 class MomentumConfig(StrategyConfig):
-    def __init__(
-        self,
-        instrument_id: str,
-        fast_period: int = 5,
-        slow_period: int = 15,
-        trade_size: float = 50.0,
-        strategy_id: str = "Momentum",
-    ) -> None:
-        super().__init__(strategy_id=strategy_id)
-        self.instrument_id_str = instrument_id
-        self.fast_period = fast_period
-        self.slow_period = slow_period
-        self.trade_size = trade_size
-
-
-class MomentumStrategy(Strategy):
+    instrument_id: InstrumentId | str
+    fast_period: int = 5
+    slow_period: int = 15
+    trade_size: float = 50.0
+    strategy_id: str = field(default="Momentum", kw_only=True)
+
+
+class MomentumStrategy(_SingleInstrumentStrategy):
     """
     EMA crossover strategy adapted for prediction markets.
 
@@ -120,65 +201,68 @@ class MomentumStrategy(Strategy):
     becoming more/less likely over time).
     """
 
+    __slots__ = (
+        "_fast_multiplier",
+        "_slow_multiplier",
+        "_warmup",
+        "fast_value",
+        "slow_value",
+        "_bar_count",
+    )
+
     def __init__(self, config: MomentumConfig) -> None:
         super().__init__(config)
-        self._config = config
-        self.instrument_id: InstrumentId | None = None
-        self.fast_ema = ExponentialMovingAverage(config.fast_period)
-        self.slow_ema = ExponentialMovingAverage(config.slow_period)
-
-    def on_start(self) -> None:
-        self.instrument_id = InstrumentId.from_str(self._config.instrument_id_str)
-
-    def on_bar(self, bar: Bar) -> None:
-        self.fast_ema.handle_bar(bar)
-        self.slow_ema.handle_bar(bar)
-        if not self.slow_ema.initialized:
+        # Both EMAs are updated together from plain floats rather than via
+        # two ExponentialMovingAverage indicators (same formula and seeding)
+        self._fast_multiplier = 2.0 / (config.fast_period + 1.0)
+        self._slow_multiplier = 2.0 / (config.slow_period + 1.0)
+        self._warmup = config.slow_period
+        self.fast_value = 0.0
+        self.slow_value = 0.0
+        self._bar_count = 0
+
+    def on_reset(self) -> None:
+        super().on_reset()
+        self.fast_value = 0.0
+        self.slow_value = 0.0
+        self._bar_count = 0
+
+    def on_bar_fast(self, ts: int, close: float) -> None:
+        self._bar_count += 1
+        if self._bar_count == 1:
+            fast = slow = close
+        else:
+            fast = self.fast_value
+            slow = self.slow_value
+            fast = (close - fast) * self._fast_multiplier + fast
+            slow = (close - slow) * self._slow_multiplier + slow
+        self.fast_value = fast
+        self.slow_value = slow
+        if self._bar_count < self._warmup:
             return
 
-        instrument = self.cache.instrument(self.instrument_id)
-        if instrument is None:
-            return
+        is_flat = self._pos_state == 0
+        is_long = self._pos_state > 0
+        signal = momentum_signal(fast, slow, is_flat, is_long)
 
-        qty = instrument.make_qty(self._config.trade_size)
-        is_flat = self.portfolio.is_flat(self.instrument_id)
-        is_long = self.portfolio.is_net_long(self.instrument_id)
-
-        if self.fast_ema.value > self.slow_ema.value:
-            if is_flat:
-                order = self.order_factory.market(
-                    instrument_id=self.instrument_id,
-                    side=OrderSide.BUY,
-                    quantity=qty,
-                    ts_init=bar.ts_event,
-                )
-                self.submit_order(order)
-        else:
-            if is_long:
-                self.close_all_positions(self.instrument_id, ts_init=bar.ts_event)
+        # Fast above slow → buy; fast below slow → sell
+        _ACTIONS[signal](self, ts)
 
 
 # ---------------------------------------------------------------------------
 # 3.  Value Strategy (model-driven)
 # ---------------------------------------------------------------------------
 
+@dataclass(frozen=True, slots=True)
 class ValueConfig(StrategyConfig):
-    def __init__(
-        self,
-        instrument_id: str,
-        fair_value: float = 0.60,
-        edge_threshold: float = 0.10,
-        trade_size: float = 50.0,
-        strategy_id: str = "Value",
-    ) -> None:
-        super().__init__(strategy_id=strategy_id)
-        self.instrument_id_str = instrument_id
-        self.fair_value = fair_value          # your model's probability estimate
-        self.edge_threshold = edge_threshold  # minimum edge to trade
-        self.trade_size = trade_size
-
-
-class ValueStrategy(Strategy):
+    instrument_id: InstrumentId | str
+    fair_value: float = 0.60       # your model's probability estimate
+    edge_threshold: float = 0.10   # minimum edge to trade
+    trade_size: float = 50.0
+    strategy_id: str = field(default="Value", kw_only=True)
+
+
+class ValueStrategy(_SingleInstrumentStrategy):
     """
     Buy when market price is below your estimated fair value by at least
     the edge threshold, sell when overpriced.
@@ -187,37 +271,47 @@ class ValueStrategy(Strategy):
     your own model (polls aggregation, news sentiment, etc.).
     """
 
-    def __init__(self, config: ValueConfig) -> None:
-        super().__init__(config)
-        self._config = config
-        self.instrument_id: InstrumentId | None = None
+    __slots__ = ("_fair_value", "_edge_threshold")
 
     def on_start(self) -> None:
-        self.instrument_id = InstrumentId.from_str(self._config.instrument_id_str)
-
-    def on_bar(self, bar: Bar) -> None:
-        instrument = self.cache.instrument(self.instrument_id)
-        if instrument is None:
-            return
-
-        price = bar.close.as_double()
+        super().on_start()
+        # Config is read once here; on_bar_fast only touches these attributes
+        self._fair_value = self._config.fair_value
+        self._edge_threshold = self._config.edge_threshold
+
+    def run_vectorized(self, closes: np.ndarray) -> list[tuple[int, str]]:
+        """
+        Replay the strategy's decisions over a whole close-price series.
+
+        The decision at each bar depends only on its close and on whether
+        the strategy is flat or long, so the entry/exit tests are done as
+        two vectorized compares and only the position state machine runs
+        as a (compiled) loop.  No orders are placed; this is for fast
+        signal research, not a substitute for an engine backtest.
+
+        Returns
+        -------
+        list[tuple[int, str]]
+            ``(bar_index, "BUY" | "SELL")`` for every position change.
+        """
+        closes = np.asarray(closes, dtype=np.float64)
         fair = self._config.fair_value
-        edge = self._config.edge_threshold
-        qty = instrument.make_qty(self._config.trade_size)
-
-        is_flat = self.portfolio.is_flat(self.instrument_id)
-        is_long = self.portfolio.is_net_long(self.instrument_id)
-
-        # Buy if market price is significantly below fair value
-        if is_flat and price < fair - edge:
-            order = self.order_factory.market(
-                instrument_id=self.instrument_id,
-                side=OrderSide.BUY,
-                quantity=qty,
-                ts_init=bar.ts_event,
-            )
-            self.submit_order(order)
-
-        # Sell if price reaches or exceeds fair value
-        elif is_long and price >= fair:
-            self.close_all_positions(self.instrument_id, ts_init=bar.ts_event)
+        buy_mask = closes < fair - self._config.edge_threshold
+        close_mask = closes >= fair
+        indices, signals = replay_long_only(buy_mask, close_mask)
+        return [
+            (i, "BUY" if signal == SIGNAL_BUY else "SELL")
+            for i, signal in zip(indices.tolist(), signals.tolist())
+        ]
+
+    def on_bar_fast(self, ts: int, close: float) -> None:
+        fair = self._fair_value
+        edge = self._edge_threshold
+
+        is_flat = self._pos_state == 0
+        is_long = self._pos_state > 0
+        signal = value_signal(close, fair, edge, is_flat, is_long)
+
+        # Buy if market price is significantly below fair value,
+        # sell if price reaches or exceeds fair value
+        _ACTIONS[signal](self, ts)
@@ -26,6 +26,7 @@ Polymarket docs:
 """
 from __future__ import annotations
 
+import functools
 import os
 import sys
 
@@ -33,6 +34,58 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
+@functools.lru_cache(maxsize=None)
+def _data_client():
+    """One data client for every part, so its pooled keep-alive connections are reused."""
+    from polymarket.data_client import PolymarketDataClient
+
+    return PolymarketDataClient()
+
+
+@functools.lru_cache(maxsize=8)
+def _synthetic_bars(instrument_id, num_bars, mu, theta, sigma, start, seed):
+    """Generated OU bars as an immutable tuple, memoized on the process parameters."""
+    from polymarket.example_backtest_synthetic import generate_ou_bars
+
+    bars, bar_type = generate_ou_bars(
+        instrument_id, num_bars=num_bars, mu=mu, theta=theta, sigma=sigma, start=start, seed=seed,
+    )
+    return tuple(bars), bar_type
+
+
+def _fresh_engine(instrument, bars):
+    """A BacktestEngine with the POLYMARKET venue, ``instrument`` and ``bars`` loaded."""
+    from nautilus_core.backtest.engine import BacktestEngine
+    from nautilus_core.enums import AccountType, OmsType
+    from nautilus_core.objects import Money
+
+    from polymarket.instruments import USDC
+
+    engine = BacktestEngine()
+    engine.add_venue(
+        venue_name="POLYMARKET",
+        oms_type=OmsType.NETTING,
+        account_type=AccountType.CASH,
+        base_currency=USDC,
+        starting_balances=[Money("10000", USDC)],
+    )
+    engine.add_instrument(instrument)
+    engine.add_data(bars)
+    return engine
+
+
+def _run_one(strategy_cls, config, instrument, bars, bar_type):
+    """Backtest one strategy on its own engine and return the BacktestResult."""
+    # Each run needs its own engine: reset() keeps account balances and
+    # cached orders/positions.  add_data copies into the engine's list.
+    engine = _fresh_engine(instrument, bars)
+    strategy = strategy_cls(config)
+    engine.add_strategy(strategy)
+    strategy.subscribe_bars(bar_type)
+    engine.run()
+    return engine.get_result()
+
+
 # ╔═══════════════════════════════════════════════════════════════════════════╗
 # ║  PART 1 — Fetching Market Data (read-only, no auth)                     ║
 # ╚═══════════════════════════════════════════════════════════════════════════╝
@@ -55,9 +108,7 @@ def part1_fetch_market_data():
     a long hex `token_id`.  Prices range from $0.01 to $0.99.  A YES token
     at $0.65 means "the market thinks there's a 65% chance this happens."
     """
-    from polymarket.data_client import PolymarketDataClient
-
-    client = PolymarketDataClient()
+    client = _data_client()
 
     # ── 1a. List top markets by volume ───────────────────────────────
     print("=" * 70)
@@ -79,14 +130,20 @@ def part1_fetch_market_data():
         print("  (no markets returned — you may be offline)")
         return None
 
-    # ── 1b. Get price history for the top market ─────────────────────
-    top_market = markets[0]
-    token_id = top_market.yes_token_id
+    # ── 1b. Get price history for the listed markets ─────────────────
+    # get_price_histories requests all tokens concurrently, so this costs
+    # about one round-trip rather than one per market
+    print(f"\n📈 Fetching price history for all {len(markets)} markets...")
+    histories = client.get_price_histories(
+        [m.yes_token_id for m in markets], interval="1w", fidelity=60,
+    )
+    for i, (m, h) in enumerate(zip(markets, histories), 1):
+        print(f"   [{i}] {len(h):4d} price points  {m.question[:50]}")
 
-    print(f"\n📈 Fetching price history for: {top_market.question[:60]}...")
-    history = client.get_price_history(token_id, interval="1w", fidelity=60)
+    top_market = markets[0]
+    history = histories[0]
 
-    print(f"   Got {len(history)} price points")
+    print(f"\n   Top market: {top_market.question[:60]}")
     if history:
         print(f"   First: t={history[0].timestamp}, p={history[0].price:.4f}")
         print(f"   Last:  t={history[-1].timestamp}, p={history[-1].price:.4f}")
@@ -109,21 +166,14 @@ def part2_backtest_real_data(market=None):
       4. Configure the backtest engine
       5. Add a strategy and run
     """
-    from decimal import Decimal
-
-    from nautilus_core.backtest.engine import BacktestEngine
-    from nautilus_core.enums import AccountType, OmsType
-    from nautilus_core.objects import Money
-
-    from polymarket.data_client import PolymarketDataClient
-    from polymarket.instruments import USDC, PredictionMarketOutcome
+    from polymarket.instruments import PredictionMarketOutcome
     from polymarket.strategies import MomentumConfig, MomentumStrategy
 
     print("\n" + "=" * 70)
     print("PART 2 — Backtesting on Real Polymarket Data")
     print("=" * 70)
 
-    client = PolymarketDataClient()
+    client = _data_client()
 
     # If we already have a market from Part 1, use it
     if market is None:
@@ -158,20 +208,11 @@ def part2_backtest_real_data(market=None):
     )
 
     # Setup engine
-    engine = BacktestEngine()
-    engine.add_venue(
-        venue_name="POLYMARKET",
-        oms_type=OmsType.NETTING,
-        account_type=AccountType.CASH,
-        base_currency=USDC,
-        starting_balances=[Money("10000", USDC)],
-    )
-    engine.add_instrument(instrument)
-    engine.add_data(bars)
+    engine = _fresh_engine(instrument, bars)
 
     # Setup strategy
     config = MomentumConfig(
-        instrument_id=str(instrument.id),
+        instrument_id=instrument.id,
         fast_period=5,
         slow_period=15,
         trade_size=100,
@@ -192,7 +233,7 @@ def part2_backtest_real_data(market=None):
 # ║  PART 3 — Backtesting with Synthetic Data (offline)                     ║
 # ╚═══════════════════════════════════════════════════════════════════════════╝
 
-def part3_backtest_synthetic():
+def part3_backtest_synthetic(regenerate=False):
     """
     Run a backtest without needing API access by generating synthetic
     prediction-market data.
@@ -200,23 +241,11 @@ def part3_backtest_synthetic():
     Prediction market prices are bounded [0, 1] so the synthetic data
     uses a mean-reverting process (Ornstein-Uhlenbeck) which is more
     realistic than a random walk for probabilities.
-    """
-    import math
-    import random
-    from decimal import Decimal
 
-    from nautilus_core.backtest.engine import BacktestEngine
-    from nautilus_core.data import Bar, BarSpecification, BarType
-    from nautilus_core.enums import (
-        AccountType,
-        BarAggregation,
-        OmsType,
-        PriceType,
-    )
-    from nautilus_core.identifiers import InstrumentId, Symbol, Venue
-    from nautilus_core.objects import Money, Price, Quantity
-
-    from polymarket.instruments import USDC, PredictionMarketOutcome
+    The bars are memoized per parameter set, so calling this again in the
+    same session reuses them; pass ``regenerate=True`` to rebuild.
+    """
+    from polymarket.instruments import PredictionMarketOutcome
     from polymarket.strategies import (
         MeanReversionConfig,
         MeanReversionStrategy,
@@ -231,13 +260,15 @@ def part3_backtest_synthetic():
     print("=" * 70)
 
     # ── Generate synthetic prediction market data ────────────────────
-    # Ornstein-Uhlenbeck process: mean-reverting around a central value
-    random.seed(42)
+    # Ornstein-Uhlenbeck process: mean-reverting around a central value.
+    # The path is simulated in a compiled loop over numpy arrays (Numba
+    # when installed, plain Python otherwise); only the Bar objects are
+    # built in Python.
     num_bars = 500
     mu = 0.55       # long-run mean (true probability)
     theta = 0.02    # mean reversion speed
     sigma = 0.03    # volatility
-    price = 0.50    # starting price
+    start = 0.50    # starting price
 
     token_id = "0x" + "a1b2c3d4" * 8  # fake token ID
     instrument = PredictionMarketOutcome(
@@ -248,37 +279,10 @@ def part3_backtest_synthetic():
         size_precision=2,
     )
 
-    short_id = token_id[:16]
     instrument_id = instrument.id
-    bar_spec = BarSpecification(60, BarAggregation.MINUTE, PriceType.MID)
-    bar_type = BarType(instrument_id, bar_spec)
-
-    base_ts = 1_700_000_000 * 1_000_000_000  # nanoseconds
-    bars: list[Bar] = []
-
-    for i in range(num_bars):
-        # OU step
-        dp = theta * (mu - price) + sigma * random.gauss(0, 1)
-        new_price = max(0.02, min(0.98, price + dp))
-
-        open_px = price
-        close_px = new_price
-        high_px = min(0.99, max(open_px, close_px) + abs(random.gauss(0, sigma * 0.3)))
-        low_px = max(0.01, min(open_px, close_px) - abs(random.gauss(0, sigma * 0.3)))
-
-        ts = base_ts + i * 3_600_000_000_000  # hourly
-
-        bars.append(Bar(
-            bar_type=bar_type,
-            open=Price(open_px, 4),
-            high=Price(high_px, 4),
-            low=Price(low_px, 4),
-            close=Price(close_px, 4),
-            volume=Quantity(0, 0),
-            ts_event=ts,
-            ts_init=ts,
-        ))
-        price = new_price
+    if regenerate:
+        _synthetic_bars.cache_clear()
+    bars, bar_type = _synthetic_bars(instrument_id, num_bars, mu, theta, sigma, start, 42)
 
     print(f"\n  Generated {len(bars)} synthetic bars")
     print(f"  Price range: {bars[0].open} -> {bars[-1].close}")
@@ -288,7 +292,7 @@ def part3_backtest_synthetic():
 
     strategies_configs = [
         ("Mean Reversion", MeanReversionStrategy, MeanReversionConfig(
-            instrument_id=str(instrument_id),
+            instrument_id=instrument_id,
             sma_period=20,
             entry_threshold=0.05,
             exit_threshold=0.02,
@@ -296,14 +300,14 @@ def part3_backtest_synthetic():
             strategy_id="MeanRev",
         )),
         ("Momentum (EMA)", MomentumStrategy, MomentumConfig(
-            instrument_id=str(instrument_id),
+            instrument_id=instrument_id,
             fast_period=5,
             slow_period=15,
             trade_size=100,
             strategy_id="Momentum",
         )),
         ("Value (fair=0.55)", ValueStrategy, ValueConfig(
-            instrument_id=str(instrument_id),
+            instrument_id=instrument_id,
             fair_value=0.55,
             edge_threshold=0.08,
             trade_size=100,
@@ -311,33 +315,17 @@ def part3_backtest_synthetic():
         )),
     ]
 
+    # Serial on purpose: a process pool's spawn + pickling costs more than these runs
     for name, strategy_cls, config in strategies_configs:
+        result = _run_one(strategy_cls, config, instrument, bars, bar_type)
+
         print(f"\n{'─' * 60}")
         print(f"  Strategy: {name}")
         print(f"{'─' * 60}")
-
-        engine = BacktestEngine()
-        engine.add_venue(
-            venue_name="POLYMARKET",
-            oms_type=OmsType.NETTING,
-            account_type=AccountType.CASH,
-            base_currency=USDC,
-            starting_balances=[Money("10000", USDC)],
-        )
-        engine.add_instrument(instrument)
-        engine.add_data(list(bars))  # copy since engine may modify
-
-        strategy = strategy_cls(config)
-        engine.add_strategy(strategy)
-        strategy.subscribe_bars(bar_type)
-
-        engine.run()
-        result = engine.get_result()
-
         print(f"  Orders:   {result.total_orders}")
         print(f"  Fills:    {result.total_fills}")
         print(f"  PnL:      ${float(result.total_return):,.2f}")
-        print(f"  Return:   {float(result.total_return / result.starting_balance * 100):.2f}%")
+        print(f"  Return:   {result.total_return_pct:.2f}%")
         print(f"  Drawdown: ${float(result.max_drawdown):,.2f}")
 
 
@@ -345,7 +333,7 @@ def part3_backtest_synthetic():
 # ║  PART 4 — Live Trading (requires .env credentials)                      ║
 # ╚═══════════════════════════════════════════════════════════════════════════╝
 
-def part4_live_trading_demo():
+def part4_live_trading_demo(market=None):
     """
     Demonstrates how to connect and trade on Polymarket.
 
@@ -387,21 +375,21 @@ def part4_live_trading_demo():
         return
 
     from polymarket.live_client import PolymarketLiveClient
-    from polymarket.data_client import PolymarketDataClient
 
     print("\n  Connecting to Polymarket...")
     live = PolymarketLiveClient()
     live.connect()
     print("  Connected!")
 
-    # Fetch a market to trade
-    data = PolymarketDataClient()
-    markets = data.get_markets(limit=1, active=True, order="volume")
-    if not markets:
-        print("  No markets available")
-        return
+    # Fetch a market to trade, unless Part 1 already picked one
+    data = _data_client()
+    if market is None:
+        markets = data.get_markets(limit=1, active=True, order="volume")
+        if not markets:
+            print("  No markets available")
+            return
+        market = markets[0]
 
-    market = markets[0]
     token_id = market.yes_token_id
     print(f"\n  Market: {market.question[:60]}")
     print(f"  YES price: {market.yes_price:.4f}")
@@ -531,6 +519,11 @@ if __name__ == "__main__":
         default=["3", "5"],
         help="Which parts to run: 1=fetch data, 2=real backtest, 3=synthetic, 4=live, 5=guide (default: 3 5)",
     )
+    parser.add_argument(
+        "--regenerate",
+        action="store_true",
+        help="Rebuild the synthetic bars for part 3 instead of reusing memoized ones",
+    )
     args = parser.parse_args()
 
     market = None
@@ -540,9 +533,9 @@ if __name__ == "__main__":
         elif part == "2":
             part2_backtest_real_data(market)
         elif part == "3":
-            part3_backtest_synthetic()
+            part3_backtest_synthetic(regenerate=args.regenerate)
         elif part == "4":
-            part4_live_trading_demo()
+            part4_live_trading_demo(market)
         elif part == "5":
             part5_custom_strategy_guide()
         else:
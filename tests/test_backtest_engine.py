@@ -1,12 +1,12 @@
 from decimal import Decimal
 
-import pytest
+import numpy as np
 
 from nautilus_core.backtest.engine import BacktestEngine
+from nautilus_core.backtest.results import BacktestResult
 from nautilus_core.data import Bar, BarSpecification, BarType
 from nautilus_core.enums import (
     AccountType,
-    AssetClass,
     BarAggregation,
     OmsType,
     OrderSide,
@@ -14,11 +14,14 @@ from nautilus_core.enums import (
 )
 from nautilus_core.identifiers import InstrumentId, Symbol, Venue
 from nautilus_core.instruments import Equity
-from nautilus_core.objects import USD, Money, Price, Quantity
+from nautilus_core.objects import USD, Money
 from nautilus_core.trading.config import StrategyConfig
 from nautilus_core.trading.strategy import Strategy
 
 
+TEST_SIM = InstrumentId(Symbol("TEST"), Venue("SIM"))
+
+
 class SimpleTestStrategy(Strategy):
     """Buy on first bar, sell on 5th bar."""
 
@@ -49,30 +52,40 @@ class SimpleTestStrategy(Strategy):
             self.close_all_positions(self.instrument_id, ts_init=bar.ts_event)
 
 
+class UnsubscribingStrategy(SimpleTestStrategy):
+    """Unsubscribe from its bars once it has seen `after` of them."""
+
+    def __init__(self, instrument_id_str: str, bar_type: BarType, after: int):
+        super().__init__(instrument_id_str)
+        self.bar_type = bar_type
+        self.after = after
+
+    def on_bar(self, bar: Bar):
+        super().on_bar(bar)
+        if self.bar_count == self.after:
+            self.unsubscribe_bars(self.bar_type)
+
+
 def _make_bars(instrument_id, n=10, start_price=100.0):
     bar_spec = BarSpecification(1, BarAggregation.MINUTE, PriceType.LAST)
     bar_type = BarType(instrument_id, bar_spec)
-    bars = []
-    price = start_price
-    for i in range(n):
-        ts = (i + 1) * 60_000_000_000
-        bars.append(Bar(
-            bar_type=bar_type,
-            open=Price(price, 2),
-            high=Price(price * 1.01, 2),
-            low=Price(price * 0.99, 2),
-            close=Price(price * 1.005, 2),
-            volume=Quantity(1000, 0),
-            ts_event=ts,
-            ts_init=ts,
-        ))
-        price = price * 1.005
+    opens = start_price * np.cumprod(np.concatenate(([1.0], np.full(n - 1, 1.005))))
+    bars = [
+        Bar.from_floats(bar_type, o, h, lo, c, 1000, 2, 0, ts, ts)
+        for o, h, lo, c, ts in zip(
+            opens.tolist(),
+            (opens * 1.01).tolist(),
+            (opens * 0.99).tolist(),
+            (opens * 1.005).tolist(),
+            range(60_000_000_000, (n + 1) * 60_000_000_000, 60_000_000_000),
+        )
+    ]
     return bars, bar_type
 
 
 class TestBacktestEngine:
     def test_basic_run(self):
-        instrument_id = InstrumentId(Symbol("TEST"), Venue("SIM"))
+        instrument_id = TEST_SIM
         instrument = Equity(
             instrument_id=instrument_id,
             quote_currency=USD,
@@ -106,6 +119,28 @@ class TestBacktestEngine:
         assert result.starting_balance == Decimal("100000.00")
         assert result.ending_balance != result.starting_balance  # something happened
 
+    def test_unsubscribed_strategy_receives_no_more_bars(self):
+        instrument = Equity(
+            instrument_id=TEST_SIM,
+            quote_currency=USD,
+            price_precision=2,
+            size_precision=0,
+        )
+        bars, bar_type = _make_bars(TEST_SIM, n=6)
+
+        engine = BacktestEngine()
+        engine.add_venue("SIM", starting_balances=[Money("100000", USD)], base_currency=USD)
+        engine.add_instrument(instrument)
+        engine.add_data(bars)
+
+        strategy = UnsubscribingStrategy("TEST.SIM", bar_type, after=2)
+        engine.add_strategy(strategy)
+        strategy.subscribe_bars(bar_type)
+
+        engine.run()
+
+        assert strategy.bar_count == 2
+
     def test_no_data_no_error(self):
         engine = BacktestEngine()
         engine.add_venue("SIM", starting_balances=[Money("100000", USD)], base_currency=USD)
@@ -116,7 +151,7 @@ class TestBacktestEngine:
         assert result.total_orders == 0
 
     def test_result_has_balance_curve(self):
-        instrument_id = InstrumentId(Symbol("TEST"), Venue("SIM"))
+        instrument_id = TEST_SIM
         instrument = Equity(
             instrument_id=instrument_id,
             quote_currency=USD,
@@ -139,7 +174,7 @@ class TestBacktestEngine:
         assert len(result.balance_curve) > 0
 
     def test_positions_created(self):
-        instrument_id = InstrumentId(Symbol("TEST"), Venue("SIM"))
+        instrument_id = TEST_SIM
         instrument = Equity(
             instrument_id=instrument_id,
             quote_currency=USD,
@@ -160,3 +195,9 @@ class TestBacktestEngine:
 
         positions = engine.cache.positions()
         assert len(positions) >= 1
+
+    def test_total_return_pct(self):
+        result = BacktestResult(starting_balance=Decimal("1000"), total_return=Decimal("25"))
+        assert result.total_return_pct == 2.5
+        assert result.to_dict()["total_return_pct"] == 2.5
+        assert BacktestResult().total_return_pct == 0.0
@@ -0,0 +1,36 @@
+from nautilus_core.cache import Cache
+from nautilus_core.enums import OrderSide
+from nautilus_core.events import OrderFilled
+from nautilus_core.identifiers import InstrumentId, PositionId, StrategyId, Symbol, TraderId, Venue
+from nautilus_core.objects import USD, Price, Quantity
+from nautilus_core.position import Position
+
+
+_AAPL_SIM = InstrumentId(Symbol("AAPL"), Venue("SIM"))
+
+
+def _make_position(position_id, strategy_id):
+    fill = OrderFilled(
+        trader_id=TraderId("TESTER-001"),
+        strategy_id=StrategyId(strategy_id),
+        instrument_id=_AAPL_SIM,
+        order_side=OrderSide.BUY,
+        last_qty=Quantity(100, 0),
+        last_px=Price("150.00", 2),
+        currency=USD,
+    )
+    return Position(_AAPL_SIM, PositionId(position_id), fill)
+
+
+class TestCache:
+    def test_positions_open_filters_strategy_on_shared_instrument(self):
+        cache = Cache()
+        pos_a = _make_position("P-1", "S-A")
+        pos_b = _make_position("P-2", "S-B")
+        cache.add_position(pos_a)
+        cache.add_position(pos_b)
+
+        assert cache.positions_open(instrument_id=_AAPL_SIM, strategy_id=StrategyId("S-A")) == [pos_a]
+        assert cache.positions_open(instrument_id=_AAPL_SIM, strategy_id=StrategyId("S-B")) == [pos_b]
+        assert cache.positions_open(instrument_id=_AAPL_SIM) == [pos_a, pos_b]
+        assert cache.positions(instrument_id=_AAPL_SIM, strategy_id=StrategyId("S-B")) == [pos_b]
@@ -0,0 +1,224 @@
+
+import json
+
+import numpy as np
+import pytest
+import requests
+
+from nautilus_core.objects import Price
+from polymarket import data_client
+from polymarket.data_client import CircuitOpenError, PolymarketDataClient, _CircuitBreaker, _parse_markets
+from polymarket.instruments import PRICE_PRECISION, price_raws
+
+
+def _client():
+    return PolymarketDataClient(use_cache=False)
+
+
+def _response(status=200, body=b"[]", headers=None):
+    resp = requests.Response()
+    resp.status_code = status
+    resp._content = body
+    resp.headers.update(headers or {})
+    resp.url = "https://example.test"
+    return resp
+
+
+class _FakeSession:
+    """Stands in for requests.Session: replays queued responses and records calls."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.calls.append((url, params, headers or {}))
+        resp = self.responses.pop(0)
+        if isinstance(resp, Exception):
+            raise resp
+        return resp
+
+
+def _client_with(*responses):
+    client = _client()
+    client._session = _FakeSession(*responses)
+    return client
+
+
+class TestPriceHistoryBars:
+    def test_price_raws_match_price(self):
+        prices = np.round(np.random.default_rng(3).uniform(0, 1, 20_000), 5)
+        expected = [Price(p, PRICE_PRECISION) for p in prices.tolist()]
+        assert [Price.from_raw(r, PRICE_PRECISION) for r in price_raws(prices).tolist()] == expected
+
+    def test_bars_match_price_objects(self, monkeypatch):
+        closes = np.array([0.28505, 0.10005, 0.5, 0.99995, 0.00015, 0.28505])
+        timestamps = np.arange(1_700_000_000, 1_700_000_000 + 60 * len(closes), 60, dtype=np.int64)
+        client = _client()
+        monkeypatch.setattr(client, "get_price_history_arrays", lambda *args, **kwargs: (timestamps, closes))
+
+        bars = client.get_price_history_as_bars("token")
+
+        # The object path: one Price per snapshot, high/low across the neighbours
+        pxs = [Price(p, PRICE_PRECISION) for p in closes.tolist()]
+        for i, bar in enumerate(bars):
+            window = pxs[max(i - 1, 0):i + 2]
+            assert bar.open == pxs[max(i - 1, 0)]
+            assert bar.close == pxs[i]
+            assert bar.high == max(window)
+            assert bar.low == min(window)
+            assert bar.ts_event == int(timestamps[i]) * 1_000_000_000
+
+
+class TestResponseCache:
+    def test_default_cache_stays_out_of_the_working_directory(self, tmp_path, monkeypatch):
+        pytest.importorskip("requests_cache")
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "user-cache"))
+
+        PolymarketDataClient()
+
+        assert not (tmp_path / "polymarket.sqlite").exists()
+
+    def test_cache_path_is_configurable(self, tmp_path):
+        pytest.importorskip("requests_cache")
+        path = tmp_path / "responses.sqlite"
+
+        PolymarketDataClient(cache_path=path)
+
+        assert path.exists()
+
+
+class TestConditionalGet:
+    def test_not_modified_reuses_body(self):
+        body = b'[{"question": "Q"}]'
+        client = _client_with(_response(body=body, headers={"ETag": '"v1"'}), _response(304))
+
+        assert client._get_conditional("https://gamma/markets", {"limit": 1}) == body
+        assert client._get_conditional("https://gamma/markets", {"limit": 1}) == body
+        assert client._session.calls[1][2] == {"If-None-Match": '"v1"'}
+
+    def test_not_modified_without_cached_body_refetches(self):
+        client = _client_with(_response(304), _response(body=b"[1]"))
+
+        assert client._get_conditional("https://gamma/markets", {}) == b"[1]"
+        assert len(client._session.calls) == 2
+        assert "If-None-Match" not in client._session.calls[1][2]
+
+    def test_validators_are_bounded(self, monkeypatch):
+        monkeypatch.setattr(data_client, "VALIDATOR_CACHE_SIZE", 2)
+        client = _client_with(*(_response(headers={"ETag": f'"{i}"'}) for i in range(3)))
+
+        for offset in range(3):
+            client._get_conditional("https://gamma/markets", {"offset": offset})
+        assert [dict(key[1])["offset"] for key in client._validators] == [1, 2]
+
+
+def _market(question, **fields):
+    return {
+        "conditionId": f"0x{question}",
+        "question": question,
+        "slug": question.lower(),
+        "outcomes": '["Yes", "No"]',
+        "outcomePrices": '["0.25", "0.75"]',
+        "clobTokenIds": '["1", "2"]',
+        "active": True,
+        "closed": False,
+        "endDate": "2026-12-31",
+        **fields,
+    }
+
+
+class TestParseMarkets:
+    def test_msgspec_matches_dict_parser(self, monkeypatch):
+        pytest.importorskip("msgspec")
+        body = json.dumps([
+            _market("A", volumeNum=12.5, liquidityNum=3.0),
+            _market("B", volume="7.25", liquidity="1"),
+            {"question": "C"},
+        ]).encode()
+
+        structs = list(_parse_markets(body, include_raw=False))
+        monkeypatch.setattr(data_client, "msgspec", None)
+        dicts = list(_parse_markets(body, include_raw=False))
+
+        assert structs == dicts
+        assert structs[1].volume == 7.25
+        assert structs[0].outcome_prices == [0.25, 0.75]
+
+
+class TestSearchMarkets:
+    def test_pages_until_a_short_page(self):
+        client = _client_with(
+            _response(body=json.dumps([_market("Rain in Paris"), _market("Snow")]).encode()),
+            _response(body=json.dumps([_market("Rain in Rome")]).encode()),
+        )
+
+        found = client.search_markets("rain", limit=5, page_size=2)
+
+        assert [m.question for m in found] == ["Rain in Paris", "Rain in Rome"]
+        assert [call[1]["offset"] for call in client._session.calls] == [0, 2]
+
+    def test_stops_once_limit_is_reached(self):
+        client = _client_with(_response(body=json.dumps([_market("Rain"), _market("Rainbow")]).encode()))
+
+        assert [m.question for m in client.search_markets("rain", limit=1, page_size=2)] == ["Rain"]
+        assert len(client._session.calls) == 1
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self):
+        breaker = _CircuitBreaker(fail_max=2, reset_timeout=60.0)
+        breaker.record_failure()
+        assert breaker.allow()
+        breaker.record_failure()
+        assert not breaker.allow()
+
+    def test_half_open_admits_a_single_trial(self):
+        breaker = _CircuitBreaker(fail_max=1, reset_timeout=0.0)
+        breaker.record_failure()
+
+        assert breaker.allow()
+        assert not breaker.allow()
+        breaker.record_success()
+        assert breaker.allow()
+        assert breaker.allow()
+
+    def test_failed_trial_reopens(self):
+        breaker = _CircuitBreaker(fail_max=3, reset_timeout=0.0)
+        for _ in range(3):
+            breaker.record_failure()
+
+        assert breaker.allow()
+        breaker.record_failure()
+        breaker.reset_timeout = 60.0
+        assert not breaker.allow()
+
+    def test_open_circuit_skips_the_session(self):
+        client = _client_with(
+            requests.ConnectionError("down"),
+            requests.ConnectionError("down"),
+        )
+        client._live_breaker = _CircuitBreaker(fail_max=2, reset_timeout=60.0)
+
+        for _ in range(2):
+            with pytest.raises(requests.ConnectionError):
+                client.get_orderbook("1")
+        with pytest.raises(CircuitOpenError):
+            client.get_orderbook("1")
+        assert len(client._session.calls) == 2
+
+
+class TestMidpointCoalescing:
+    def test_calls_within_window_share_one_request(self):
+        client = _client_with(_response(body=b'{"mid": "0.42"}'), _response(body=b'{"mid": "0.43"}'))
+
+        assert client.get_midpoint("1") == 0.42
+        assert client.get_midpoint("1") == 0.42
+        assert len(client._session.calls) == 1
+
+        # Age the cached reply past the coalescing window
+        ts, data = client._last_midpoint["1"]
+        client._last_midpoint["1"] = (ts - data_client.MIDPOINT_COALESCE_WINDOW, data)
+        assert client.get_midpoint("1") == 0.43
+        assert len(client._session.calls) == 2
@@ -1,7 +1,7 @@
 """Integration test: EMA cross strategy on synthetic trending data."""
 from decimal import Decimal
 
-import pytest
+import numpy as np
 import sys
 import os
 
@@ -17,35 +17,29 @@ from nautilus_core.enums import (
 )
 from nautilus_core.identifiers import InstrumentId, Symbol, Venue
 from nautilus_core.instruments import Equity
-from nautilus_core.objects import USD, Money, Price, Quantity
+from nautilus_core.objects import USD, Money
 
 from ema_cross_strategy import EMACrossStrategy, EMACrossStrategyConfig
 
 
 def _generate_trending_bars(bar_type, n=200, start=100.0, trend=0.001):
     """Generate bars with a clear upward trend so EMA cross fires."""
-    import random
-    random.seed(123)
-    bars = []
-    price = start
-    for i in range(n):
-        change = trend + random.gauss(0, 0.005)
-        open_px = price
-        close_px = price * (1 + change)
-        high_px = max(open_px, close_px) * 1.002
-        low_px = min(open_px, close_px) * 0.998
-        ts = (i + 1) * 60_000_000_000
-        bars.append(Bar(
-            bar_type=bar_type,
-            open=Price(open_px, 2),
-            high=Price(high_px, 2),
-            low=Price(low_px, 2),
-            close=Price(close_px, 2),
-            volume=Quantity(5000, 0),
-            ts_event=ts,
-            ts_init=ts,
-        ))
-        price = close_px
+    rng = np.random.default_rng(123)
+    changes = trend + rng.normal(0.0, 0.005, n)
+    closes = start * np.cumprod(1.0 + changes)
+    opens = np.concatenate(([start], closes[:-1]))
+    highs = np.maximum(opens, closes) * 1.002
+    lows = np.minimum(opens, closes) * 0.998
+    bars = [
+        Bar.from_floats(bar_type, o, h, lo, c, 5000, 2, 0, ts, ts)
+        for o, h, lo, c, ts in zip(
+            opens.tolist(),
+            highs.tolist(),
+            lows.tolist(),
+            closes.tolist(),
+            range(60_000_000_000, (n + 1) * 60_000_000_000, 60_000_000_000),
+        )
+    ]
     return bars
 
 
@@ -76,8 +70,8 @@ class TestEMACrossIntegration:
         engine.add_data(bars)
 
         config = EMACrossStrategyConfig(
-            instrument_id="AAPL.SIM",
-            bar_type=str(bar_type),
+            instrument_id=instrument_id,
+            bar_type=bar_type,
             fast_period=10,
             slow_period=30,
             trade_size=100,
@@ -129,8 +123,8 @@ class TestEMACrossIntegration:
         engine.add_data(bars)
 
         config = EMACrossStrategyConfig(
-            instrument_id="AAPL.SIM",
-            bar_type=str(bar_type),
+            instrument_id=instrument_id,
+            bar_type=bar_type,
             fast_period=10,
             slow_period=30,
             trade_size=100,
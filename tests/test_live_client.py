@@ -0,0 +1,50 @@
+from types import SimpleNamespace
+
+import pytest
+
+from polymarket import live_client
+from polymarket.live_client import OrderSpec, PolymarketLiveClient
+
+
+class _FakeClob:
+    """Stands in for ClobClient: records signed and posted orders."""
+
+    def __init__(self):
+        self.signed = []
+        self.posted = []
+
+    def create_order(self, args):
+        self.signed.append(args)
+        return args
+
+    def post_orders(self, batch):
+        self.posted.append(batch)
+        return [{"success": True} for _ in batch]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    # py-clob-client's types, reduced to what place_batch touches
+    monkeypatch.setattr(live_client, "OrderArgs", SimpleNamespace, raising=False)
+    monkeypatch.setattr(live_client, "PostOrdersArgs", SimpleNamespace)
+    monkeypatch.setattr(live_client, "_SIDES", {"BUY": 0, "SELL": 1}, raising=False)
+    monkeypatch.setattr(live_client, "_ORDER_TYPES", {"GTC": "GTC"}, raising=False)
+    client = PolymarketLiveClient(private_key="0x1")
+    client._client = _FakeClob()
+    return client
+
+
+class TestPlaceBatch:
+    def test_sides_map_to_clob_constants(self, client):
+        client.place_batch([OrderSpec("1", "BUY", 0.4, 10), OrderSpec("1", "SELL", 0.6, 10)])
+
+        assert [args.side for args in client.client.signed] == [0, 1]
+
+    @pytest.mark.parametrize("side", ["buy", "Buy", "SELLL", ""])
+    def test_unknown_side_raises_before_anything_is_posted(self, client, side):
+        specs = [OrderSpec("1", "BUY", 0.4, 10), OrderSpec("1", side, 0.6, 10)]
+
+        with pytest.raises(ValueError, match="Unknown side"):
+            client.place_batch(specs)
+        assert client.client.signed == []
+        assert client.client.posted == []
@@ -2,7 +2,20 @@ from decimal import Decimal
 
 import pytest
 
-from nautilus_core.objects import USD, EUR, BTC, AccountBalance, Currency, Money, Price, Quantity
+import numpy as np
+
+from nautilus_core.data import Bar, BarSpecification, BarType
+from nautilus_core.enums import BarAggregation, PriceType
+from nautilus_core.identifiers import InstrumentId
+from nautilus_core.objects import USD, EUR, AccountBalance, Money, Price, Quantity, raw_half_up
+
+
+_OPS = {
+    "+": lambda a, b: a + b,
+    "-": lambda a, b: a - b,
+    "*": lambda a, b: a * b,
+    "neg": lambda a, _: -a,
+}
 
 
 class TestPrice:
@@ -15,22 +28,27 @@ class TestPrice:
         p = Price("100.555", 2)
         assert p.value == Decimal("100.56")
 
-    def test_add(self):
-        p1 = Price("100.00", 2)
-        p2 = Price("50.25", 2)
-        result = p1 + p2
-        assert result.value == Decimal("150.25")
-
-    def test_sub(self):
-        p1 = Price("100.00", 2)
-        p2 = Price("50.25", 2)
-        result = p1 - p2
-        assert result.value == Decimal("49.75")
-
-    def test_mul(self):
-        p = Price("100.00", 2)
-        result = p * 2
-        assert result.value == Decimal("200.00")
+    def test_from_raw(self):
+        p = Price.from_raw(5025, 4)
+        assert p == Price("0.5025", 4)
+        assert str(p) == "0.5025"
+        assert p.precision == 4
+        assert str(Price.from_raw(0, 2)) == "0.00"
+
+    @pytest.mark.parametrize(
+        "op,a,b,expected",
+        [
+            ("+", "100.00", "50.25", "150.25"),
+            ("-", "100.00", "50.25", "49.75"),
+            ("*", "100.00", 2, "200.00"),
+            ("neg", "100.00", None, "-100.00"),
+        ],
+    )
+    def test_arithmetic(self, op, a, b, expected):
+        if isinstance(b, str):
+            b = Price(b, 2)
+        result = _OPS[op](Price(a, 2), b)
+        assert result.value == Decimal(expected)
 
     def test_comparison(self):
         p1 = Price("100.00", 2)
@@ -40,11 +58,6 @@ class TestPrice:
         assert p1 <= p1
         assert p1 >= p1
 
-    def test_neg(self):
-        p = Price("100.00", 2)
-        result = -p
-        assert result.value == Decimal("-100.00")
-
     def test_equality(self):
         p1 = Price("100.00", 2)
         p2 = Price("100.00", 2)
@@ -55,26 +68,45 @@ class TestPrice:
         assert p.as_double() == 100.50
 
 
+class TestRawHalfUp:
+    def test_matches_price_on_binary_ties(self):
+        # 0.285 and 1.005 sit just below the half tick in binary floating point
+        assert raw_half_up(0.285, 2) == 29
+        assert raw_half_up(1.005, 2) == 101
+        assert raw_half_up(-0.125, 2) == -13
+
+    def test_matches_price_and_quantity(self):
+        rng = np.random.default_rng(7)
+        for x in np.round(rng.uniform(0, 2, 5000), 5).tolist():
+            for precision in (2, 4):
+                assert Price.from_raw(raw_half_up(x, precision), precision) == Price(x, precision)
+                assert Quantity.from_raw(raw_half_up(x, precision), precision) == Quantity(x, precision)
+
+    def test_bar_from_floats_matches_price(self):
+        bar_type = BarType(InstrumentId.from_str("TEST.SIM"), BarSpecification(1, BarAggregation.MINUTE, PriceType.LAST))
+        bar = Bar.from_floats(bar_type, 0.285, 1.005, 0.285, 1.005, 2.5, 2, 0, 0, 0)
+        assert bar.open == Price(0.285, 2)
+        assert bar.high == Price(1.005, 2)
+        assert bar.close == Price("1.01", 2)
+        assert bar.volume == Quantity(3, 0)
+
+
 class TestQuantity:
     def test_creation(self):
         q = Quantity("10.5", 1)
         assert q.value == Decimal("10.5")
 
-    def test_non_negative(self):
+    def test_from_raw(self):
+        q = Quantity.from_raw(1050, 2)
+        assert q == Quantity("10.50", 2)
+        assert q.precision == 2
         with pytest.raises(ValueError):
-            Quantity("-1", 0)
+            Quantity.from_raw(-1, 0)
 
-    def test_add(self):
-        q1 = Quantity("10", 0)
-        q2 = Quantity("5", 0)
-        result = q1 + q2
-        assert result.value == Decimal("15")
-
-    def test_sub(self):
-        q1 = Quantity("10", 0)
-        q2 = Quantity("5", 0)
-        result = q1 - q2
-        assert result.value == Decimal("5")
+    @pytest.mark.parametrize("op,a,b,expected", [("+", "10", "5", "15"), ("-", "10", "5", "5")])
+    def test_arithmetic(self, op, a, b, expected):
+        result = _OPS[op](Quantity(a, 0), Quantity(b, 0))
+        assert result.value == Decimal(expected)
 
     def test_bool_nonzero(self):
         assert bool(Quantity("10", 0)) is True
@@ -91,35 +123,25 @@ class TestMoney:
     def test_creation(self):
         m = Money("1000.00", USD)
         assert m.amount == Decimal("1000.00")
-        assert m.currency == USD
-
-    def test_add_same_currency(self):
-        m1 = Money("100.00", USD)
-        m2 = Money("50.00", USD)
-        result = m1 + m2
-        assert result.amount == Decimal("150.00")
-
-    def test_add_different_currency_raises(self):
-        m1 = Money("100.00", USD)
-        m2 = Money("50.00", EUR)
-        with pytest.raises(ValueError):
-            m1 + m2
-
-    def test_sub(self):
-        m1 = Money("100.00", USD)
-        m2 = Money("30.00", USD)
-        result = m1 - m2
-        assert result.amount == Decimal("70.00")
-
-    def test_neg(self):
-        m = Money("100.00", USD)
-        result = -m
-        assert result.amount == Decimal("-100.00")
+        assert m.currency is USD
+
+    @pytest.mark.parametrize(
+        "op,a,b,expected",
+        [
+            ("+", "100.00", "50.00", "150.00"),
+            ("-", "100.00", "30.00", "70.00"),
+            ("neg", "100.00", None, "-100.00"),
+        ],
+    )
+    def test_arithmetic(self, op, a, b, expected):
+        if b is not None:
+            b = Money(b, USD)
+        result = _OPS[op](Money(a, USD), b)
+        assert result.amount == Decimal(expected)
 
     def test_repr(self):
         m = Money("100.00", USD)
-        assert "100.00" in repr(m)
-        assert "USD" in repr(m)
+        assert repr(m) == "Money(100.00, USD)"
 
 
 class TestAccountBalance:
@@ -132,10 +154,21 @@ class TestAccountBalance:
         assert bal.locked.amount == Decimal("200.00")
         assert bal.free.amount == Decimal("800.00")
 
-    def test_mismatched_currency_raises(self):
-        with pytest.raises(ValueError):
-            AccountBalance(
+
+class TestInvalidObjects:
+    @pytest.mark.parametrize(
+        "factory",
+        [
+            lambda: Quantity("-1", 0),
+            lambda: Money("100.00", USD) + Money("50.00", EUR),
+            lambda: AccountBalance(
                 total=Money("1000.00", USD),
                 locked=Money("200.00", EUR),
                 free=Money("800.00", USD),
-            )
+            ),
+        ],
+        ids=["negative_quantity", "add_different_currency", "balance_mismatched_currency"],
+    )
+    def test_raises_value_error(self, factory):
+        with pytest.raises(ValueError):
+            factory()
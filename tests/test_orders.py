@@ -1,3 +1,5 @@
+import uuid
+from dataclasses import replace
 from decimal import Decimal
 
 import pytest
@@ -5,7 +7,6 @@ import pytest
 from nautilus_core.enums import OrderSide, OrderStatus, OrderType, TimeInForce
 from nautilus_core.events import (
     OrderAccepted,
-    OrderCanceled,
     OrderDenied,
     OrderFilled,
     OrderInitialized,
@@ -13,7 +14,6 @@ from nautilus_core.events import (
     OrderSubmitted,
 )
 from nautilus_core.identifiers import (
-    AccountId,
     ClientOrderId,
     InstrumentId,
     StrategyId,
@@ -27,76 +27,92 @@ from nautilus_core.objects import USD, Money, Price, Quantity
 from nautilus_core.orders import LimitOrder, MarketOrder, StopMarketOrder
 
 
+_Q0 = Quantity("0", 0)
+_Q40 = Quantity("40", 0)
+_Q60 = Quantity("60", 0)
+_Q100 = Quantity("100", 0)
+_PX_150 = Price("150.00", 2)
+_VOID = VenueOrderId("V-001")
+_TID_1 = TradeId("T-001")
+_TID_2 = TradeId("T-002")
+
+
 def _make_instrument_id():
     return InstrumentId(Symbol("AAPL"), Venue("SIM"))
 
 
+_BASE_MARKET_INIT = OrderInitialized(
+    trader_id=TraderId("TESTER-001"),
+    strategy_id=StrategyId("S-001"),
+    instrument_id=_make_instrument_id(),
+    client_order_id=ClientOrderId("O-001"),
+    order_side=OrderSide.BUY,
+    order_type=OrderType.MARKET,
+    quantity=_Q100,
+    time_in_force=TimeInForce.GTC,
+)
+
+
 def _make_market_order_init(**kwargs):
-    defaults = dict(
-        trader_id=TraderId("TESTER-001"),
-        strategy_id=StrategyId("S-001"),
-        instrument_id=_make_instrument_id(),
-        client_order_id=ClientOrderId("O-001"),
-        order_side=OrderSide.BUY,
-        order_type=OrderType.MARKET,
-        quantity=Quantity("100", 0),
-        time_in_force=TimeInForce.GTC,
-    )
-    defaults.update(kwargs)
-    return OrderInitialized(**defaults)
+    # replace() would otherwise copy the template's event_id into every init
+    kwargs.setdefault("event_id", str(uuid.uuid4()))
+    return replace(_BASE_MARKET_INIT, **kwargs)
 
 
 class TestMarketOrder:
     def test_creation(self):
         init = _make_market_order_init()
         order = MarketOrder(init)
-        assert order.status == OrderStatus.INITIALIZED
-        assert order.side == OrderSide.BUY
-        assert order.quantity == Quantity("100", 0)
-        assert order.filled_qty == Quantity("0", 0)
+        assert order.status is OrderStatus.INITIALIZED
+        assert order.side is OrderSide.BUY
+        assert order.quantity == _Q100
+        assert order.filled_qty == _Q0
 
     def test_submit_accept_fill_lifecycle(self):
         init = _make_market_order_init()
         order = MarketOrder(init)
+        coid = order.client_order_id
 
         # Submit
-        submitted = OrderSubmitted(client_order_id=order.client_order_id)
+        submitted = OrderSubmitted(client_order_id=coid)
         order.apply(submitted)
-        assert order.status == OrderStatus.SUBMITTED
+        assert order.status is OrderStatus.SUBMITTED
 
         # Accept
         accepted = OrderAccepted(
-            client_order_id=order.client_order_id,
-            venue_order_id=VenueOrderId("V-001"),
+            client_order_id=coid,
+            venue_order_id=_VOID,
         )
         order.apply(accepted)
-        assert order.status == OrderStatus.ACCEPTED
-        assert order.venue_order_id == VenueOrderId("V-001")
+        assert order.status is OrderStatus.ACCEPTED
+        assert order.venue_order_id == _VOID
 
         # Fill
         filled = OrderFilled(
-            client_order_id=order.client_order_id,
-            venue_order_id=VenueOrderId("V-001"),
-            trade_id=TradeId("T-001"),
+            client_order_id=coid,
+            venue_order_id=_VOID,
+            trade_id=_TID_1,
             order_side=OrderSide.BUY,
             order_type=OrderType.MARKET,
-            last_qty=Quantity("100", 0),
-            last_px=Price("150.00", 2),
+            last_qty=_Q100,
+            last_px=_PX_150,
             currency=USD,
             commission=Money("0.30", USD),
         )
         order.apply(filled)
-        assert order.status == OrderStatus.FILLED
-        assert order.filled_qty == Quantity("100", 0)
-        assert order.leaves_qty == Quantity("0", 0)
-        assert order.avg_px == Decimal("150.00")
+        assert (order.status, order.filled_qty, order.leaves_qty, order.avg_px) == (
+            OrderStatus.FILLED,
+            _Q100,
+            _Q0,
+            Decimal("150.00"),
+        )
 
     def test_denied(self):
         init = _make_market_order_init()
         order = MarketOrder(init)
         denied = OrderDenied(client_order_id=order.client_order_id, reason="No funds")
         order.apply(denied)
-        assert order.status == OrderStatus.DENIED
+        assert order.status is OrderStatus.DENIED
 
     def test_rejected(self):
         init = _make_market_order_init()
@@ -104,7 +120,7 @@ class TestMarketOrder:
         order.apply(OrderSubmitted(client_order_id=order.client_order_id))
         rejected = OrderRejected(client_order_id=order.client_order_id, reason="Invalid")
         order.apply(rejected)
-        assert order.status == OrderStatus.REJECTED
+        assert order.status is OrderStatus.REJECTED
 
     def test_invalid_transition_raises(self):
         init = _make_market_order_init()
@@ -115,39 +131,38 @@ class TestMarketOrder:
     def test_partial_fill(self):
         init = _make_market_order_init()
         order = MarketOrder(init)
-        order.apply(OrderSubmitted(client_order_id=order.client_order_id))
-        order.apply(OrderAccepted(client_order_id=order.client_order_id, venue_order_id=VenueOrderId("V-001")))
+        coid = order.client_order_id
+        order.apply(OrderSubmitted(client_order_id=coid))
+        order.apply(OrderAccepted(client_order_id=coid, venue_order_id=_VOID))
 
         # Partial fill
         filled1 = OrderFilled(
-            client_order_id=order.client_order_id,
-            trade_id=TradeId("T-001"),
+            client_order_id=coid,
+            trade_id=_TID_1,
             order_side=OrderSide.BUY,
             order_type=OrderType.MARKET,
-            last_qty=Quantity("60", 0),
-            last_px=Price("150.00", 2),
+            last_qty=_Q60,
+            last_px=_PX_150,
             currency=USD,
             commission=Money("0.18", USD),
         )
         order.apply(filled1)
-        assert order.status == OrderStatus.PARTIALLY_FILLED
-        assert order.filled_qty == Quantity("60", 0)
-        assert order.leaves_qty == Quantity("40", 0)
+        assert (order.status, order.filled_qty, order.leaves_qty) == (OrderStatus.PARTIALLY_FILLED, _Q60, _Q40)
 
         # Complete fill
         filled2 = OrderFilled(
-            client_order_id=order.client_order_id,
-            trade_id=TradeId("T-002"),
+            client_order_id=coid,
+            trade_id=_TID_2,
             order_side=OrderSide.BUY,
             order_type=OrderType.MARKET,
-            last_qty=Quantity("40", 0),
+            last_qty=_Q40,
             last_px=Price("151.00", 2),
             currency=USD,
             commission=Money("0.12", USD),
         )
         order.apply(filled2)
-        assert order.status == OrderStatus.FILLED
-        assert order.filled_qty == Quantity("100", 0)
+        assert order.status is OrderStatus.FILLED
+        assert order.filled_qty == _Q100
 
 
 class TestLimitOrder:
@@ -159,12 +174,12 @@ class TestLimitOrder:
             client_order_id=ClientOrderId("O-002"),
             order_side=OrderSide.BUY,
             order_type=OrderType.LIMIT,
-            quantity=Quantity("100", 0),
+            quantity=_Q100,
             price=Price("149.00", 2),
         )
         order = LimitOrder(init)
         assert order.price == Price("149.00", 2)
-        assert order.order_type == OrderType.LIMIT
+        assert order.order_type is OrderType.LIMIT
 
     def test_limit_requires_price(self):
         init = OrderInitialized(
@@ -174,7 +189,7 @@ class TestLimitOrder:
             client_order_id=ClientOrderId("O-003"),
             order_side=OrderSide.BUY,
             order_type=OrderType.LIMIT,
-            quantity=Quantity("100", 0),
+            quantity=_Q100,
         )
         with pytest.raises(ValueError, match="requires a price"):
             LimitOrder(init)
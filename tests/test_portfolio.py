@@ -1,10 +1,11 @@
 from decimal import Decimal
+from functools import lru_cache
 
 import pytest
 
 from nautilus_core.account import CashAccount
 from nautilus_core.cache import Cache
-from nautilus_core.enums import OrderSide, OrderType, PositionSide
+from nautilus_core.enums import OrderSide, OrderType
 from nautilus_core.events import OrderFilled
 from nautilus_core.identifiers import (
     AccountId,
@@ -23,81 +24,129 @@ from nautilus_core.portfolio import Portfolio
 from nautilus_core.position import Position
 
 
-def _instrument_id():
-    return InstrumentId(Symbol("AAPL"), Venue("SIM"))
+_AAPL_SIM = InstrumentId(Symbol("AAPL"), Venue("SIM"))
+_PID = PositionId("P-001")
+_AID = AccountId("SIM-001")
+_ZERO_USD = Money("0.00", USD)
+_INITIAL_USD = Money("100000.00", USD)
+_INITIAL_BALANCE = AccountBalance(_INITIAL_USD, _ZERO_USD, _INITIAL_USD)
+_FILL_BASE = dict(
+    trader_id=TraderId("TESTER-001"),
+    strategy_id=StrategyId("S-001"),
+    instrument_id=_AAPL_SIM,
+    client_order_id=ClientOrderId("O-001"),
+    venue_order_id=VenueOrderId("V-001"),
+    account_id=_AID,
+    trade_id=TradeId("T-001"),
+    order_type=OrderType.MARKET,
+    currency=USD,
+)
+
+
+@lru_cache(maxsize=None)
+def _qty(value):
+    return Quantity(value, 0)
+
+
+@lru_cache(maxsize=None)
+def _px(value):
+    return Price(value, 2)
 
 
 def _make_fill(side, qty, px):
     return OrderFilled(
-        trader_id=TraderId("TESTER-001"),
-        strategy_id=StrategyId("S-001"),
-        instrument_id=_instrument_id(),
-        client_order_id=ClientOrderId("O-001"),
-        venue_order_id=VenueOrderId("V-001"),
-        account_id=AccountId("SIM-001"),
-        trade_id=TradeId("T-001"),
+        **_FILL_BASE,
         order_side=side,
-        order_type=OrderType.MARKET,
-        last_qty=Quantity(qty, 0),
-        last_px=Price(px, 2),
-        currency=USD,
-        commission=Money("0.00", USD),
+        last_qty=_qty(qty),
+        last_px=_px(px),
+        commission=_ZERO_USD,
     )
 
 
+@pytest.fixture
+def cache():
+    cache = Cache()
+    # Accounts replace balances rather than mutating them, so tests can share one balance
+    cache.add_account(CashAccount(_AID, USD, [_INITIAL_BALANCE]))
+    return cache
+
+
+@pytest.fixture
+def portfolio(cache):
+    return Portfolio(cache)
+
+
 class TestPortfolio:
-    def setup_method(self):
-        self.cache = Cache()
-        self.portfolio = Portfolio(self.cache)
-        # Add account
-        account = CashAccount(
-            AccountId("SIM-001"),
-            USD,
-            [AccountBalance(Money("100000.00", USD), Money("0.00", USD), Money("100000.00", USD))],
-        )
-        self.cache.add_account(account)
-
-    def test_flat_when_no_positions(self):
-        assert self.portfolio.is_flat(_instrument_id())
-        assert self.portfolio.net_position(_instrument_id()) == Decimal("0")
-
-    def test_net_long(self):
+    def test_flat_when_no_positions(self, portfolio):
+        assert portfolio.is_flat(_AAPL_SIM)
+        assert portfolio.net_position(_AAPL_SIM) == Decimal("0")
+
+    def test_net_long(self, cache, portfolio):
         fill = _make_fill(OrderSide.BUY, "100", "150.00")
-        pos = Position(_instrument_id(), PositionId("P-001"), fill)
-        self.cache.add_position(pos)
+        pos = Position(_AAPL_SIM, _PID, fill)
+        cache.add_position(pos)
 
-        assert self.portfolio.is_net_long(_instrument_id())
-        assert not self.portfolio.is_net_short(_instrument_id())
-        assert self.portfolio.net_position(_instrument_id()) == Decimal("100")
+        assert portfolio.is_net_long(_AAPL_SIM)
+        assert not portfolio.is_net_short(_AAPL_SIM)
+        assert portfolio.net_position(_AAPL_SIM) == Decimal("100")
 
-    def test_net_short(self):
+    def test_net_short(self, cache, portfolio):
         fill = _make_fill(OrderSide.SELL, "100", "150.00")
-        pos = Position(_instrument_id(), PositionId("P-001"), fill)
-        self.cache.add_position(pos)
+        pos = Position(_AAPL_SIM, _PID, fill)
+        cache.add_position(pos)
 
-        assert self.portfolio.is_net_short(_instrument_id())
-        assert not self.portfolio.is_net_long(_instrument_id())
+        assert portfolio.is_net_short(_AAPL_SIM)
+        assert not portfolio.is_net_long(_AAPL_SIM)
 
-    def test_unrealized_pnl(self):
+    def test_unrealized_pnl(self, cache, portfolio):
         fill = _make_fill(OrderSide.BUY, "100", "150.00")
-        pos = Position(_instrument_id(), PositionId("P-001"), fill)
-        self.cache.add_position(pos)
+        pos = Position(_AAPL_SIM, _PID, fill)
+        cache.add_position(pos)
 
-        pnl = self.portfolio.unrealized_pnl(_instrument_id(), Price("155.00", 2))
+        pnl = portfolio.unrealized_pnl(_AAPL_SIM, Price("155.00", 2))
         assert pnl == Decimal("500.00")
 
-    def test_realized_pnl_after_close(self):
+    def test_realized_pnl_after_close(self, cache, portfolio):
         open_fill = _make_fill(OrderSide.BUY, "100", "150.00")
-        pos = Position(_instrument_id(), PositionId("P-001"), open_fill)
+        pos = Position(_AAPL_SIM, _PID, open_fill)
         close_fill = _make_fill(OrderSide.SELL, "100", "160.00")
         pos.apply(close_fill)
-        self.cache.add_position(pos)
+        cache.add_position(pos)
 
-        pnl = self.portfolio.realized_pnl(_instrument_id())
+        pnl = portfolio.realized_pnl(_AAPL_SIM)
         assert pnl == Decimal("1000.00")
 
-    def test_balance_total(self):
+    def test_balance_total(self, portfolio):
         venue = Venue("SIM")
-        bal = self.portfolio.balance_total(venue)
+        bal = portfolio.balance_total(venue)
         assert bal is not None
         assert bal.amount == Decimal("100000.00")
+
+    def test_total_pnl_realized_plus_unrealized(self, cache, portfolio):
+        open_fill = _make_fill(OrderSide.BUY, "100", "150.00")
+        pos = Position(_AAPL_SIM, _PID, open_fill)
+        pos.apply(_make_fill(OrderSide.SELL, "50", "160.00"))
+        cache.add_position(pos)
+
+        # realized = (160-150)*50 = 500, unrealized = (155-150)*50 = 250
+        pnl = portfolio.total_pnl(_AAPL_SIM, Price("155.00", 2))
+        assert pnl == Decimal("750.00")
+
+    def test_flat_after_position_closed_and_updated(self, cache, portfolio):
+        pos = Position(_AAPL_SIM, _PID, _make_fill(OrderSide.BUY, "100", "150.00"))
+        cache.add_position(pos)
+        assert cache.positions_open(instrument_id=_AAPL_SIM) == [pos]
+
+        pos.apply(_make_fill(OrderSide.SELL, "100", "160.00"))
+        cache.update_position(pos)
+
+        assert cache.positions_open(instrument_id=_AAPL_SIM) == []
+        assert portfolio.is_flat(_AAPL_SIM)
+
+    def test_cache_reset_clears_positions(self, cache, portfolio):
+        cache.add_position(Position(_AAPL_SIM, _PID, _make_fill(OrderSide.BUY, "100", "150.00")))
+        cache.reset()
+
+        assert cache.positions_open(instrument_id=_AAPL_SIM) == []
+        assert cache.accounts() == []
+        assert portfolio.is_flat(_AAPL_SIM)
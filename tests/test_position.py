@@ -1,4 +1,5 @@
 from decimal import Decimal
+from functools import lru_cache
 
 import pytest
 
@@ -20,141 +21,128 @@ from nautilus_core.objects import USD, Money, Price, Quantity
 from nautilus_core.position import Position
 
 
+_AAPL_SIM = InstrumentId(Symbol("AAPL"), Venue("SIM"))
+_PID = PositionId("P-001")
+_PNL_500 = Decimal("500.00")
+_PNL_1000 = Decimal("1000.00")
+_Q50 = Quantity("50", 0)
+_Q100 = Quantity("100", 0)
+_PX_145 = Price("145.00", 2)
+_PX_155 = Price("155.00", 2)
+_FILL_BASE = dict(
+    trader_id=TraderId("TESTER-001"),
+    strategy_id=StrategyId("S-001"),
+    instrument_id=_AAPL_SIM,
+    client_order_id=ClientOrderId("O-001"),
+    venue_order_id=VenueOrderId("V-001"),
+    account_id=AccountId("SIM-001"),
+    trade_id=TradeId("T-001"),
+    order_type=OrderType.MARKET,
+    currency=USD,
+)
+
+
+@lru_cache(maxsize=None)
+def _qty(value: str) -> Quantity:
+    return Quantity(value, 0)
+
+
+@lru_cache(maxsize=None)
+def _px(value: str) -> Price:
+    return Price(value, 2)
+
+
+@lru_cache(maxsize=None)
+def _usd(value: str) -> Money:
+    return Money(value, USD)
+
+
 def _make_fill(side: OrderSide, qty: str, px: str, commission: str = "0.00") -> OrderFilled:
     return OrderFilled(
-        trader_id=TraderId("TESTER-001"),
-        strategy_id=StrategyId("S-001"),
-        instrument_id=InstrumentId(Symbol("AAPL"), Venue("SIM")),
-        client_order_id=ClientOrderId("O-001"),
-        venue_order_id=VenueOrderId("V-001"),
-        account_id=AccountId("SIM-001"),
-        trade_id=TradeId("T-001"),
+        **_FILL_BASE,
         order_side=side,
-        order_type=OrderType.MARKET,
-        last_qty=Quantity(qty, 0),
-        last_px=Price(px, 2),
-        currency=USD,
-        commission=Money(commission, USD),
+        last_qty=_qty(qty),
+        last_px=_px(px),
+        commission=_usd(commission),
     )
 
 
+def _open_position(side: OrderSide, qty: str = "100", px: str = "150.00", commission: str = "0.00") -> Position:
+    return Position(_AAPL_SIM, _PID, _make_fill(side, qty, px, commission))
+
+
+def _apply_close(pos: Position, side: OrderSide, qty: str, px: str, commission: str = "0.00") -> None:
+    pos.apply(_make_fill(side, qty, px, commission))
+
+
 class TestPosition:
-    def test_open_long(self):
-        fill = _make_fill(OrderSide.BUY, "100", "150.00")
-        pos = Position(
-            InstrumentId(Symbol("AAPL"), Venue("SIM")),
-            PositionId("P-001"),
-            fill,
-        )
-        assert pos.side == PositionSide.LONG
+    @pytest.mark.parametrize(
+        "side,expected_side,is_long,is_short",
+        [
+            (OrderSide.BUY, PositionSide.LONG, True, False),
+            (OrderSide.SELL, PositionSide.SHORT, False, True),
+        ],
+    )
+    def test_open(self, side, expected_side, is_long, is_short):
+        pos = _open_position(side)
+        assert pos.side is expected_side
         assert pos.is_open
-        assert pos.is_long
-        assert not pos.is_short
-        assert pos.quantity == Quantity("100", 0)
+        assert pos.is_long is is_long
+        assert pos.is_short is is_short
+        assert pos.quantity == _Q100
         assert pos.avg_px_open == Decimal("150.00")
 
-    def test_open_short(self):
-        fill = _make_fill(OrderSide.SELL, "100", "150.00")
-        pos = Position(
-            InstrumentId(Symbol("AAPL"), Venue("SIM")),
-            PositionId("P-001"),
-            fill,
-        )
-        assert pos.side == PositionSide.SHORT
-        assert pos.is_short
-        assert pos.quantity == Quantity("100", 0)
-
-    def test_close_long_pnl(self):
-        # Open long at 150
-        open_fill = _make_fill(OrderSide.BUY, "100", "150.00", "1.50")
-        pos = Position(
-            InstrumentId(Symbol("AAPL"), Venue("SIM")),
-            PositionId("P-001"),
-            open_fill,
-        )
-
-        # Close at 160 => profit of (160-150) * 100 = 1000
-        close_fill = _make_fill(OrderSide.SELL, "100", "160.00", "1.60")
-        pos.apply(close_fill)
-
-        assert pos.side == PositionSide.FLAT
+    # Opened at 150 and closed for a (160-150) or (150-140) * 100 = 1000 profit
+    @pytest.mark.parametrize(
+        "open_side,close_side,close_px",
+        [
+            (OrderSide.BUY, OrderSide.SELL, "160.00"),
+            (OrderSide.SELL, OrderSide.BUY, "140.00"),
+        ],
+    )
+    def test_close_pnl(self, open_side, close_side, close_px):
+        pos = _open_position(open_side, commission="1.50")
+        _apply_close(pos, close_side, "100", close_px, "1.60")
+
+        assert pos.side is PositionSide.FLAT
         assert pos.is_closed
-        assert pos.realized_pnl == Decimal("1000.00")
+        assert pos.realized_pnl == _PNL_1000
         assert pos.commissions[USD] == Decimal("3.10")
 
-    def test_close_short_pnl(self):
-        # Open short at 150
-        open_fill = _make_fill(OrderSide.SELL, "100", "150.00")
-        pos = Position(
-            InstrumentId(Symbol("AAPL"), Venue("SIM")),
-            PositionId("P-001"),
-            open_fill,
-        )
-
-        # Close at 140 => profit of (150-140) * 100 = 1000
-        close_fill = _make_fill(OrderSide.BUY, "100", "140.00")
-        pos.apply(close_fill)
-
-        assert pos.is_closed
-        assert pos.realized_pnl == Decimal("1000.00")
-
-    def test_unrealized_pnl_long(self):
-        fill = _make_fill(OrderSide.BUY, "100", "150.00")
-        pos = Position(
-            InstrumentId(Symbol("AAPL"), Venue("SIM")),
-            PositionId("P-001"),
-            fill,
-        )
-        # Last price at 155 => unrealized = (155-150) * 100 = 500
-        unrealized = pos.unrealized_pnl(Price("155.00", 2))
-        assert unrealized == Decimal("500.00")
-
-    def test_unrealized_pnl_short(self):
-        fill = _make_fill(OrderSide.SELL, "100", "150.00")
-        pos = Position(
-            InstrumentId(Symbol("AAPL"), Venue("SIM")),
-            PositionId("P-001"),
-            fill,
-        )
-        # Last price at 145 => unrealized = (150-145) * 100 = 500
-        unrealized = pos.unrealized_pnl(Price("145.00", 2))
-        assert unrealized == Decimal("500.00")
+    # Opened at 150 and marked 5 in the money => unrealized = 5 * 100 = 500
+    @pytest.mark.parametrize("side,last_px", [(OrderSide.BUY, "155.00"), (OrderSide.SELL, "145.00")])
+    def test_unrealized_pnl(self, side, last_px):
+        pos = _open_position(side)
+        unrealized = pos.unrealized_pnl(Price(last_px, 2))
+        assert unrealized == _PNL_500
 
     def test_total_pnl(self):
         # Open at 150, partial close at 160, then check total with last at 155
-        open_fill = _make_fill(OrderSide.BUY, "100", "150.00")
-        pos = Position(
-            InstrumentId(Symbol("AAPL"), Venue("SIM")),
-            PositionId("P-001"),
-            open_fill,
-        )
-        partial_close = _make_fill(OrderSide.SELL, "50", "160.00")
-        pos.apply(partial_close)
-
-        assert pos.realized_pnl == Decimal("500.00")  # (160-150)*50
-        assert pos.quantity == Quantity("50", 0)
-
-        total = pos.total_pnl(Price("155.00", 2))
+        pos = _open_position(OrderSide.BUY)
+        _apply_close(pos, OrderSide.SELL, "50", "160.00")
+
+        assert pos.realized_pnl == _PNL_500  # (160-150)*50
+        assert pos.quantity == _Q50
+
+        total = pos.total_pnl(_PX_155)
         # realized = 500 + unrealized = (155-150)*50 = 250 => 750
         assert total == Decimal("750.00")
 
     def test_notional_value(self):
-        fill = _make_fill(OrderSide.BUY, "100", "150.00")
-        pos = Position(
-            InstrumentId(Symbol("AAPL"), Venue("SIM")),
-            PositionId("P-001"),
-            fill,
-        )
-        notional = pos.notional_value(Price("155.00", 2))
+        pos = _open_position(OrderSide.BUY)
+        notional = pos.notional_value(_PX_155)
         assert notional == Decimal("15500.00")
 
     def test_flat_position_unrealized_pnl_zero(self):
-        fill = _make_fill(OrderSide.BUY, "100", "150.00")
-        pos = Position(
-            InstrumentId(Symbol("AAPL"), Venue("SIM")),
-            PositionId("P-001"),
-            fill,
-        )
-        close_fill = _make_fill(OrderSide.SELL, "100", "160.00")
-        pos.apply(close_fill)
+        pos = _open_position(OrderSide.BUY)
+        _apply_close(pos, OrderSide.SELL, "100", "160.00")
         assert pos.unrealized_pnl(Price("200.00", 2)) == Decimal("0")
+
+    def test_marks_are_exact_decimals(self):
+        pos = _open_position(OrderSide.BUY, "1", "0.01")
+        assert str(pos.unrealized_pnl(_px("0.03"))) == "0.02"
+        assert str(pos.notional_value(_px("0.03"))) == "0.03"
+
+        short = _open_position(OrderSide.SELL)
+        assert short.unrealized_pnl(_PX_145) == _PNL_500
+        assert short.notional_value(_PX_145) == Decimal("14500.00")
@@ -0,0 +1,123 @@
+from decimal import Decimal
+
+from nautilus_core.cache import Cache
+from nautilus_core.enums import OrderSide, TradingState
+from nautilus_core.events import OrderFilled
+from nautilus_core.identifiers import InstrumentId, PositionId, StrategyId, Symbol, TraderId, Venue
+from nautilus_core.instruments import Equity
+from nautilus_core.msgbus import MessageBus
+from nautilus_core.objects import USD, Price, Quantity
+from nautilus_core.order_factory import OrderFactory
+from nautilus_core.portfolio import Portfolio
+from nautilus_core.position import Position
+from nautilus_core.risk_engine import RiskEngine
+
+
+def _instrument_id():
+    return InstrumentId(Symbol("AAPL"), Venue("SIM"))
+
+
+def _make_engine(**instrument_kwargs):
+    cache = Cache()
+    cache.add_instrument(Equity(instrument_id=_instrument_id(), quote_currency=USD, **instrument_kwargs))
+    engine = RiskEngine(Portfolio(cache), cache, MessageBus())
+    factory = OrderFactory(TraderId("TESTER-001"), StrategyId("S-001"))
+    return engine, factory
+
+
+def _add_long_position(cache, qty):
+    fill = OrderFilled(
+        trader_id=TraderId("TESTER-001"),
+        strategy_id=StrategyId("S-001"),
+        instrument_id=_instrument_id(),
+        order_side=OrderSide.BUY,
+        last_qty=Quantity(qty, 0),
+        last_px=Price("150.00", 2),
+        currency=USD,
+    )
+    cache.add_position(Position(_instrument_id(), PositionId("P-001"), fill))
+
+
+class TestRiskEngine:
+    def test_valid_market_order(self):
+        engine, factory = _make_engine()
+        order = factory.market(_instrument_id(), OrderSide.BUY, Quantity(100, 0))
+        assert engine.validate_order(order) is None
+
+    def test_halted_denies(self):
+        engine, factory = _make_engine()
+        engine.set_trading_state(TradingState.HALTED)
+        order = factory.market(_instrument_id(), OrderSide.BUY, Quantity(100, 0))
+        denied = engine.validate_order(order)
+        assert denied is not None
+        assert denied.reason == "Trading is HALTED"
+
+    def test_unknown_instrument_denies(self):
+        engine, factory = _make_engine()
+        other = InstrumentId(Symbol("MSFT"), Venue("SIM"))
+        order = factory.market(other, OrderSide.BUY, Quantity(100, 0))
+        denied = engine.validate_order(order)
+        assert denied is not None
+        assert "MSFT.SIM" in denied.reason
+
+    def test_quantity_precision_denies(self):
+        engine, factory = _make_engine()
+        order = factory.market(_instrument_id(), OrderSide.BUY, Quantity("1.5", 1))
+        denied = engine.validate_order(order)
+        assert denied is not None
+        assert "quantity precision" in denied.reason
+
+    def test_min_quantity(self):
+        engine, factory = _make_engine(min_quantity=Quantity(10, 0))
+        below = factory.market(_instrument_id(), OrderSide.BUY, Quantity(9, 0))
+        at_min = factory.market(_instrument_id(), OrderSide.BUY, Quantity(10, 0))
+        assert "below minimum" in engine.validate_order(below).reason
+        assert engine.validate_order(at_min) is None
+
+    def test_max_quantity(self):
+        engine, factory = _make_engine(max_quantity=Quantity(1000, 0))
+        above = factory.market(_instrument_id(), OrderSide.BUY, Quantity(1001, 0))
+        at_max = factory.market(_instrument_id(), OrderSide.BUY, Quantity(1000, 0))
+        assert "above maximum" in engine.validate_order(above).reason
+        assert engine.validate_order(at_max) is None
+
+    def test_max_quantity_beyond_float_resolution(self):
+        limit = Decimal("10000000000000000")
+        engine, factory = _make_engine(max_quantity=Quantity(limit, 0))
+        order = factory.market(_instrument_id(), OrderSide.BUY, Quantity(limit + 1, 0))
+        assert float(order.quantity) == float(limit)
+        assert "above maximum" in engine.validate_order(order).reason
+
+    def test_limit_price_precision_denies(self):
+        engine, factory = _make_engine()
+        order = factory.limit(_instrument_id(), OrderSide.BUY, Quantity(100, 0), Price("150.123", 3))
+        denied = engine.validate_order(order)
+        assert denied is not None
+        assert "price precision" in denied.reason
+
+    def test_reducing_denies_opening_order(self):
+        engine, factory = _make_engine()
+        engine.set_trading_state(TradingState.REDUCING)
+        order = factory.market(_instrument_id(), OrderSide.BUY, Quantity(100, 0))
+        denied = engine.validate_order(order)
+        assert denied is not None
+        assert "REDUCING" in denied.reason
+
+    def test_zero_quantity_without_limits(self):
+        engine, factory = _make_engine()
+        order = factory.market(_instrument_id(), OrderSide.BUY, Quantity(0, 0))
+        assert engine.validate_order(order) is None
+
+    def test_reducing_allows_reducing_order(self):
+        engine, factory = _make_engine()
+        _add_long_position(engine._cache, 100)
+        engine.set_trading_state(TradingState.REDUCING)
+        sell = factory.market(_instrument_id(), OrderSide.SELL, Quantity(100, 0))
+        buy = factory.market(_instrument_id(), OrderSide.BUY, Quantity(100, 0))
+        assert engine.validate_order(sell) is None
+        assert engine.validate_order(buy) is not None
+
+    def test_first_failing_check_is_reported(self):
+        engine, factory = _make_engine(min_quantity=Quantity(10, 0))
+        order = factory.limit(_instrument_id(), OrderSide.BUY, Quantity(5, 0), Price("150.123", 3))
+        assert "below minimum" in engine.validate_order(order).reason